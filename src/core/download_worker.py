@@ -5,25 +5,44 @@ This module provides a QThread worker that runs the download process
 in the background without blocking the GUI.
 """
 
+import re
 import time
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Optional
+from urllib.parse import urlparse
 from PySide6.QtCore import QThread, Signal
 
-from src.core.downloader import DownloadCore, DownloadProgress
+from src.core.rate_limiter import RateLimiter
+from src.utils.config import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_DOWNLOAD_DELAY,
+    PER_HOST_DOWNLOAD_LIMIT,
+    PROGRESS_UPDATE_INTERVAL,
+)
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.core.downloader import DownloadCore
+
 logger = get_logger(__name__)
 
+# Host part of an absolute URL, e.g. "app.snapchat.com"
+HOST_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)")
+
 
 class DownloadWorker(QThread):
     """Background worker thread for downloading Snapchat memories.
     
     This QThread runs the download process in the background and emits
-    signals to update the GUI with progress information.
+    signals to update the GUI with progress information. Downloads are
+    network-bound, so up to ``max_concurrency`` of them run at once on a
+    thread pool, with at most ``per_host_limit`` against any single host.
     
     Signals:
-        progress_updated: Emitted when progress changes (DownloadProgress object)
+        progress_updated: Emitted when progress changes (downloaded, skipped, total, current_file)
         status_message: Emitted with status text (str)
         file_downloaded: Emitted when a file is downloaded (filename, success, message)
         finished: Emitted when download completes (success, total_downloaded, total_failed)
@@ -31,54 +50,119 @@ class DownloadWorker(QThread):
     """
     
     # Define signals
-    progress_updated = Signal(object)  # DownloadProgress object
+    progress_updated = Signal(int, int, int, str)  # downloaded, skipped, total, current_file
     status_message = Signal(str)       # Status text
     file_downloaded = Signal(str, bool, str)  # filename, success, message
     finished = Signal(bool, int, int)  # success, total_downloaded, total_failed
     error = Signal(str)                # error_message
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Optional[Dict] = None):
         """Initialize the download worker.
         
+        The worker is reusable: call ``configure`` with the settings for
+        each run before calling ``start``.
+        
+        Args:
+            config: Initial configuration dictionary (optional), see
+                ``configure`` for the supported keys
+        """
+        super().__init__()
+        
+        self.config: Dict = {}
+        self.downloader: Optional["DownloadCore"] = None
+        # HTTP session kept across runs so its connections stay warm
+        self._session = None
+        self._session_pool_size = 0
+        self._start_time = 0.0
+        self._last_progress_emit = 0.0
+        self._is_running = False
+        self._stop_event = threading.Event()
+        
+        if config is not None:
+            self.configure(config)
+        
+        logger.debug("DownloadWorker initialized")
+    
+    def configure(self, config: Dict):
+        """Set the configuration for the next run and reset per-run state.
+        
+        Must not be called while the worker is running.
+        
         Args:
             config: Configuration dictionary containing:
                 - html_file: Path to memories_history.html
                 - output_dir: Output directory for downloads
                 - delay: Delay between downloads (seconds)
+                - max_concurrency: Maximum downloads in flight at once
+                - per_host_limit: Maximum downloads in flight per host
                 - gps_enabled: Whether to extract GPS data
                 - overlay_enabled: Whether to composite overlays
                 - timezone_enabled: Whether to convert timezones
                 - year_folders: Whether to organize by year
         """
-        super().__init__()
-        
         self.config = config
-        self.downloader: DownloadCore = None
-        self._is_running = False
-        self._should_stop = False
+        self.downloader = None
+        self._start_time = 0.0
+        self._stop_event.clear()
         
-        logger.info(f"DownloadWorker initialized with config: {config}")
+        logger.info("DownloadWorker configured with config: %s", config)
     
     def run(self):
         """Main thread execution - runs the download process."""
         self._is_running = True
-        self._should_stop = False
         
         try:
-            # Initialize downloader
+            if not self._preflight_paths(
+                self.config['html_file'], self.config['output_dir']
+            ):
+                self.finished.emit(False, 0, 0)
+                return
+            
+            max_concurrency = max(
+                1, self.config.get('max_concurrency', DEFAULT_DOWNLOAD_CONCURRENCY)
+            )
+            per_host_limit = max(
+                1, self.config.get('per_host_limit', PER_HOST_DOWNLOAD_LIMIT)
+            )
+            
+            # Initialize downloader; requests and bs4 load here on first use
+            # rather than at application start
+            from src.core.downloader import DownloadCore, create_session
+            
+            # Reuse the previous run's session unless the pool must grow
+            if self._session is None or self._session_pool_size < max_concurrency:
+                if self._session is not None:
+                    self._session.close()
+                self._session = create_session(max_concurrency)
+                self._session_pool_size = max_concurrency
+            
             self.status_message.emit("Initializing downloader...")
             self.downloader = DownloadCore(
                 html_file=self.config['html_file'],
-                output_dir=self.config['output_dir']
+                output_dir=self.config['output_dir'],
+                pool_size=max_concurrency,
+                session=self._session,
             )
             
+            # One ExifTool process serves every GPS write in this run
+            if self.config.get('gps_enabled'):
+                from src.utils.exiftool_service import ExifToolService, find_exiftool
+                
+                exiftool_path = find_exiftool()
+                if exiftool_path:
+                    exiftool = ExifToolService(exiftool_path)
+                    exiftool.start()
+                    self.downloader.exiftool = exiftool
+                else:
+                    self.status_message.emit("ExifTool not found - GPS embedding disabled")
+            
             # Load existing progress
             self.status_message.emit("Loading previous progress...")
             self.downloader.load_progress()
             
             # Parse HTML to get memories list
             self.status_message.emit("Parsing HTML file...")
-            memories = self.downloader.parse_html_for_memories()
+            memories = self.downloader.load_or_parse_memories()
             
             if not memories:
                 self.error.emit("No memories found in HTML file")
@@ -86,66 +170,69 @@ class DownloadWorker(QThread):
                 return
             
             # Setup progress tracking
+            # Skip memories recorded in the progress file or already on disk
+            existing_files = self.downloader.scan_existing_files()
+            pending = [
+                m for m in memories if self.downloader.is_pending(m, existing_files)
+            ]
+            already_downloaded = len(memories) - len(pending)
             self.downloader.progress.total_files = len(memories)
-            already_downloaded = len([m for m in memories if self.downloader.is_downloaded(m['sid'])])
             self.downloader.progress.skipped_files = already_downloaded
             
             # Emit initial status
             self.status_message.emit(
                 f"Found {len(memories)} memories ({already_downloaded} already downloaded)"
             )
-            self.progress_updated.emit(self.downloader.progress)
+            self._emit_progress(force=True)
             
-            # Download each memory
-            delay = self.config.get('delay', 2.0)
-            start_time = time.time()
+            # Requests are paced at one per `delay` seconds across all hosts
+            # however many downloads are in flight; concurrency only overlaps
+            # the slow transfers. The per-host slots just cap how many
+            # connections one host sees at once.
+            delay = self.config.get('delay', DEFAULT_DOWNLOAD_DELAY)
+            rate_limiter = RateLimiter(rate=1 / delay) if delay > 0 else None
+            self._start_time = time.time()
             
-            for i, memory in enumerate(memories, 1):
-                # Check if we should stop
-                if self._should_stop:
-                    self.status_message.emit("Download cancelled by user")
-                    break
-                
-                # Update current file
-                self.downloader.progress.current_file = memory['filename']
-                
-                # Calculate ETA
-                if i > 1:
-                    elapsed = time.time() - start_time
-                    files_processed = self.downloader.progress.downloaded_files + self.downloader.progress.skipped_files
-                    if files_processed > 0:
-                        avg_time_per_file = elapsed / files_processed
-                        remaining_files = self.downloader.progress.total_files - files_processed
-                        self.downloader.progress.eta_seconds = int(avg_time_per_file * remaining_files)
-                        self.downloader.progress.current_speed = files_processed / elapsed
-                
-                # Emit progress
-                self.progress_updated.emit(self.downloader.progress)
-                
-                # Download the file
-                success, message = self.downloader.download_memory(memory)
-                
-                # Emit file status
-                self.file_downloaded.emit(memory['filename'], success, message)
-                
-                if success and message != "Already downloaded":
-                    self.status_message.emit(f"Downloaded: {memory['filename']}")
-                elif not success:
-                    self.status_message.emit(f"Failed: {memory['filename']} - {message}")
-                
-                # Update progress
-                self.progress_updated.emit(self.downloader.progress)
+            host_slots: Dict[str, threading.BoundedSemaphore] = defaultdict(
+                lambda: threading.BoundedSemaphore(per_host_limit)
+            )
+            in_flight: Dict[Future, Dict] = {}
+            
+            with ThreadPoolExecutor(
+                max_workers=max_concurrency, thread_name_prefix="download"
+            ) as executor:
+                for memory in pending:
+                    # Wait for a free slot before dispatching the next file
+                    while len(in_flight) >= max_concurrency:
+                        self._report_results(in_flight)
+                    
+                    # Check if we should stop
+                    if self._stop_event.is_set():
+                        self.status_message.emit("Download cancelled by user")
+                        break
+                    
+                    host = self._host_of(memory['download_url'])
+                    future = executor.submit(
+                        self._download_one,
+                        memory,
+                        host_slots[host],
+                        rate_limiter,
+                    )
+                    in_flight[future] = memory
                 
-                # Delay between downloads (except for last file or already downloaded)
-                if i < len(memories) and message != "Already downloaded":
-                    time.sleep(delay)
+                # Drain the remaining downloads
+                while in_flight:
+                    self._report_results(in_flight)
+            
+            # Make sure the final counts reach the UI
+            self._emit_progress(force=True)
             
             # Final statistics
             downloaded = self.downloader.progress.downloaded_files
             failed = self.downloader.progress.failed_files
             skipped = self.downloader.progress.skipped_files
             
-            if self._should_stop:
+            if self._stop_event.is_set():
                 self.status_message.emit(
                     f"Download cancelled - {downloaded} downloaded, {failed} failed, {skipped} skipped"
                 )
@@ -167,12 +254,158 @@ class DownloadWorker(QThread):
             self.finished.emit(False, 0, 0)
             
         finally:
+            if self.downloader and self.downloader.exiftool:
+                self.downloader.exiftool.close()
+                self.downloader.exiftool = None
             self._is_running = False
     
+    def _preflight_paths(self, html_file: str, output_dir: str) -> bool:
+        """Validate the input file and create the output folder.
+        
+        Runs on the worker thread so slow filesystems (network shares,
+        removable drives) never block the GUI.
+        
+        Args:
+            html_file: Path to memories_history.html
+            output_dir: Output directory for downloads
+            
+        Returns:
+            True if both paths are usable, False after emitting an error
+        """
+        if not Path(html_file).exists():
+            self.error.emit(f"The HTML file does not exist:\n{html_file}")
+            return False
+        
+        try:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.error(f"Failed to create output folder {output_dir}: {e}")
+            self.error.emit(f"Failed to create output folder:\n{str(e)}")
+            return False
+        
+        return True
+    
+    def _download_one(
+        self,
+        memory: Dict,
+        host_slot: threading.BoundedSemaphore,
+        rate_limiter: Optional[RateLimiter],
+    ):
+        """Download a single memory on a pool thread.
+        
+        Args:
+            memory: Memory dictionary with download info
+            host_slot: Semaphore bounding concurrent requests to the memory's host
+            rate_limiter: Token bucket shared by all downloads in the run
+                (None for no limit)
+            
+        Only the network transfer holds the host slot. Extraction, GPS
+        embedding and the final rename run after it is released, so the
+        next download from the host can start meanwhile.
+        
+        Returns:
+            (success, message) tuple as from DownloadCore.download_memory
+        """
+        if self._stop_event.is_set():
+            return False, "Cancelled"
+        if self.downloader.is_downloaded(memory['sid']):
+            return True, "Already downloaded"
+        
+        with host_slot:
+            # A stop request interrupts the wait for a token
+            if rate_limiter and not rate_limiter.acquire(self._stop_event):
+                return False, "Cancelled"
+            temp_file, message = self.downloader.fetch_memory(memory)
+        
+        if temp_file is None:
+            return False, message
+        return self.downloader.finish_memory(memory, temp_file)
+    
+    @staticmethod
+    def _host_of(url: str) -> str:
+        """Get the host a download URL points at.
+        
+        Args:
+            url: Download URL
+        
+        Returns:
+            Host (network location) of the URL
+        """
+        host_match = HOST_PATTERN.match(url)
+        if host_match:
+            return host_match.group(1)
+        return urlparse(url).netloc
+    
+    def _report_results(self, in_flight: Dict[Future, Dict]):
+        """Wait for at least one download to finish and report it.
+        
+        Completed futures are removed from ``in_flight`` and their results
+        are emitted as file and progress signals.
+        
+        Args:
+            in_flight: Mapping of pending futures to their memory dictionaries
+        """
+        progress = self.downloader.progress
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        
+        for future in done:
+            memory = in_flight.pop(future)
+            success, message = future.result()
+            
+            if message == "Cancelled":
+                continue
+            
+            # Emit file status. Successful files are reported through the
+            # progress update below, so only failures get a status message.
+            self.file_downloaded.emit(memory['filename'], success, message)
+            
+            if not success:
+                self.status_message.emit(f"Failed: {memory['filename']} - {message}")
+            
+            progress.current_file = memory['filename']
+        
+        # Calculate ETA
+        elapsed = time.time() - self._start_time
+        files_processed = (
+            progress.downloaded_files + progress.failed_files
+        )
+        if files_processed > 0 and elapsed > 0:
+            avg_time_per_file = elapsed / files_processed
+            remaining_files = (
+                progress.total_files - progress.skipped_files - files_processed
+            )
+            progress.eta_seconds = int(avg_time_per_file * remaining_files)
+            progress.current_speed = files_processed / elapsed
+        
+        # Update progress
+        self._emit_progress()
+    
+    def _emit_progress(self, force: bool = False):
+        """Emit the current download progress as plain values.
+        
+        Emissions are throttled to one per PROGRESS_UPDATE_INTERVAL so fast
+        runs don't queue more updates than the UI can repaint.
+        
+        Args:
+            force: Emit even if the last update was sent too recently
+        """
+        now = time.monotonic()
+        if not force and now - self._last_progress_emit < PROGRESS_UPDATE_INTERVAL / 1000:
+            return
+        self._last_progress_emit = now
+        
+        progress = self.downloader.progress
+        self.progress_updated.emit(
+            progress.downloaded_files,
+            progress.skipped_files,
+            progress.total_files,
+            progress.current_file,
+        )
+    
     def stop(self):
         """Request the worker to stop downloading."""
         logger.info("Stop requested for download worker")
-        self._should_stop = True
+        self._stop_event.set()
         self.status_message.emit("Stopping download...")
     
     @property
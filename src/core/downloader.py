@@ -6,18 +6,136 @@ refactored from the CLI version for GUI integration.
 """
 
 import os
+import re
 import time
 import zipfile
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from src.utils.config import DOWNLOAD_BUFFER_SIZE, STREAM_CHUNK_SIZE
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.utils.exiftool_service import ExifToolService
+
 logger = get_logger(__name__)
 
+# Location cell format: "Latitude, Longitude: 51.5, -0.12"
+GPS_PATTERN = re.compile(r"(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)")
+
+# onclick format: "downloadMemories('https://...', this, true); return false;"
+DOWNLOAD_URL_PATTERN = re.compile(r"downloadMemories\('([^']+)'")
+
+# Query parameter carrying the memory's session ID
+SID_PATTERN = re.compile(r"[?&]sid=([^&#]+)")
+
+
+def extract_sid(url: str) -> str:
+    """Extract session ID from download URL."""
+    # URL format: https://app.snapchat.com/web/deeplink/snapcode?...&sid=XXXXX
+    sid_match = SID_PATTERN.search(url)
+    if sid_match:
+        return sid_match.group(1)
+    # Use hash of URL as fallback
+    return str(hash(url))
+
+
+def create_session(pool_size: int) -> requests.Session:
+    """Create an HTTP session with a keep-alive connection pool.
+    
+    Args:
+        pool_size: Number of keep-alive connections per host
+    
+    Returns:
+        Session with the pool mounted for http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def parse_memories_html(html_file: Path) -> List[Dict]:
+    """Parse a memories HTML export into memory dictionaries.
+    
+    Kept at module level so it can run in a worker process.
+    
+    Args:
+        html_file: Path to memories_history.html
+    
+    Returns:
+        List of memory dictionaries with download info
+    """
+    from bs4 import BeautifulSoup
+    
+    logger.info(f"Parsing HTML file: {html_file}")
+    
+    if not html_file.exists():
+        raise FileNotFoundError(f"HTML file not found: {html_file}")
+    
+    with open(html_file, 'r', encoding='utf-8') as f:
+        soup = BeautifulSoup(f.read(), 'html.parser')
+    
+    memories = []
+    
+    # Find all table rows
+    # Snapchat format: <a onclick="downloadMemories('URL', ...)">Download</a>
+    for row in soup.find_all('tr'):
+        cells = row.find_all('td')
+        if len(cells) < 3:
+            continue
+        
+        # Extract date (first cell)
+        date_text = cells[0].get_text(strip=True) if cells else ""
+        
+        # Extract media type (second cell)
+        media_type_text = cells[1].get_text(strip=True) if len(cells) > 1 else ""
+        
+        # Extract GPS coordinates (third cell)
+        location_text = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+        
+        # Extract download link (fourth cell with onclick)
+        download_link = cells[3].find('a', onclick=True) if len(cells) > 3 else None
+        if not download_link:
+            continue
+        
+        # Parse onclick attribute to get URL
+        # Format: onclick="downloadMemories('https://...', this, true); return false;"
+        onclick = download_link.get('onclick', '')
+        url_match = DOWNLOAD_URL_PATTERN.search(onclick)
+        if not url_match:
+            continue
+        
+        download_url = url_match.group(1)
+        
+        # Generate filename from date and media type
+        # Format: YYYY-MM-DD_HH-MM-SS_UTC.ext
+        date_clean = date_text.replace(' UTC', '').replace(' ', '_').replace(':', '-')
+        ext = '.mp4' if media_type_text.lower() == 'video' else '.jpg'
+        filename = f"{date_clean}{ext}"
+        
+        memory = {
+            'download_url': download_url,
+            'filename': filename,
+            'sid': extract_sid(download_url),
+            'media_type': media_type_text.lower() if media_type_text else 'unknown',
+            'date': date_text,
+            'location': location_text if location_text else None,
+        }
+        
+        memories.append(memory)
+    
+    logger.info(f"Found {len(memories)} memories in HTML")
+    return memories
+
 
 @dataclass
 class DownloadProgress:
@@ -45,22 +163,47 @@ class DownloadCore:
     and file management. It is designed to work with both CLI and GUI.
     """
     
-    def __init__(self, html_file: str, output_dir: str):
+    def __init__(
+        self,
+        html_file: str,
+        output_dir: str,
+        pool_size: int = 10,
+        session: Optional[requests.Session] = None,
+    ):
         """Initialize the downloader.
         
         Args:
             html_file: Path to memories_history.html from Snapchat export
             output_dir: Directory where memories will be saved
+            pool_size: Number of keep-alive connections per host, should be
+                at least the number of concurrent downloads
+            session: Existing session to reuse (optional). Passing the
+                session from a previous run keeps its open connections,
+                so later runs skip the TLS handshakes.
         """
         self.html_file = Path(html_file)
         self.output_dir = Path(output_dir)
-        self.session = requests.Session()
+        self.session = session if session is not None else create_session(pool_size)
         self.progress = DownloadProgress()
         
+        # download_memory() may be called from several threads at once;
+        # the lock guards the progress counters and the progress file.
+        self._lock = threading.Lock()
+        
+        # One copy buffer per download thread, allocated on first use and
+        # reused for every file that thread writes
+        self._buffers = threading.local()
+        
         # Progress tracking file
         self.progress_file = self.output_dir / "download_progress.json"
         self._downloaded_sids: set = set()
         
+        # Shared ExifTool process for GPS embedding (set by the caller)
+        self.exiftool: Optional["ExifToolService"] = None
+        
+        # Parsed memories index, reused while the HTML file is unchanged
+        self.index_file = self.output_dir / ".snapchat_index.json"
+        
         # Create output directories
         self._create_output_dirs()
         
@@ -78,79 +221,66 @@ class DownloadCore:
     def parse_html_for_memories(self) -> List[Dict]:
         """Parse the HTML file to extract memory download URLs.
         
+        Parsing is CPU-bound, so it runs in a separate process to keep it
+        off the GIL shared with the UI. Falls back to parsing in this
+        process if a worker process cannot be started.
+        
         Returns:
             List of memory dictionaries with download info
         """
-        from bs4 import BeautifulSoup
-        import re
-        
-        logger.info(f"Parsing HTML file: {self.html_file}")
-        
         if not self.html_file.exists():
             raise FileNotFoundError(f"HTML file not found: {self.html_file}")
         
-        with open(self.html_file, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f.read(), 'html.parser')
+        try:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                return executor.submit(parse_memories_html, self.html_file).result()
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Parse process unavailable, parsing in-process: {e}")
+            return parse_memories_html(self.html_file)
+    
+    def load_or_parse_memories(self) -> List[Dict]:
+        """Get the memories list, from the index cache when possible.
         
-        memories = []
+        The cache is keyed by the HTML file's path, size and modification
+        time, so a changed or different export is parsed again.
         
-        # Find all table rows
-        # Snapchat format: <a onclick="downloadMemories('URL', ...)">Download</a>
-        for row in soup.find_all('tr'):
-            cells = row.find_all('td')
-            if len(cells) < 3:
-                continue
-            
-            # Extract date (first cell)
-            date_text = cells[0].get_text(strip=True) if cells else ""
-            
-            # Extract media type (second cell)
-            media_type_text = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-            
-            # Extract GPS coordinates (third cell)
-            location_text = cells[2].get_text(strip=True) if len(cells) > 2 else ""
-            
-            # Extract download link (fourth cell with onclick)
-            download_link = cells[3].find('a', onclick=True) if len(cells) > 3 else None
-            if not download_link:
-                continue
-            
-            # Parse onclick attribute to get URL
-            # Format: onclick="downloadMemories('https://...', this, true); return false;"
-            onclick = download_link.get('onclick', '')
-            url_match = re.search(r"downloadMemories\('([^']+)'", onclick)
-            if not url_match:
-                continue
-            
-            download_url = url_match.group(1)
-            
-            # Generate filename from date and media type
-            # Format: YYYY-MM-DD_HH-MM-SS_UTC.ext
-            date_clean = date_text.replace(' UTC', '').replace(' ', '_').replace(':', '-')
-            ext = '.mp4' if media_type_text.lower() == 'video' else '.jpg'
-            filename = f"{date_clean}{ext}"
-            
-            memory = {
-                'download_url': download_url,
-                'filename': filename,
-                'sid': self._extract_sid(download_url),
-                'media_type': media_type_text.lower() if media_type_text else 'unknown',
-                'date': date_text,
-                'location': location_text if location_text else None,
-            }
-            
-            memories.append(memory)
+        Returns:
+            List of memory dictionaries with download info
+        """
+        import json
+        
+        stat = self.html_file.stat()
+        key = {
+            'html_file': str(self.html_file.resolve()),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('key') == key:
+                memories = data['memories']
+                logger.info(f"Loaded {len(memories)} memories from index cache")
+                return memories
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable index cache: {e}")
+        
+        memories = self.parse_html_for_memories()
+        
+        try:
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'memories': memories}, f)
+        except OSError as e:
+            logger.warning(f"Could not write index cache: {e}")
         
-        logger.info(f"Found {len(memories)} memories in HTML")
         return memories
     
     def _extract_sid(self, url: str) -> str:
         """Extract session ID from download URL."""
-        # URL format: https://app.snapchat.com/web/deeplink/snapcode?...&sid=XXXXX
-        if 'sid=' in url:
-            return url.split('sid=')[1].split('&')[0]
-        # Use hash of URL as fallback
-        return str(hash(url))
+        return extract_sid(url)
     
     def _detect_media_type_from_name(self, filename: str) -> str:
         """Detect media type from filename extension."""
@@ -200,13 +330,46 @@ class DownloadCore:
         """
         import json
         
-        self._downloaded_sids.add(sid)
+        with self._lock:
+            self._downloaded_sids.add(sid)
+            
+            try:
+                with open(self.progress_file, 'w') as f:
+                    json.dump({'downloaded': list(self._downloaded_sids)}, f, indent=2)
+            except Exception as e:
+                logger.error(f"Error saving progress: {e}")
+    
+    def scan_existing_files(self) -> Set[str]:
+        """List the media files already present in the output folders.
         
-        try:
-            with open(self.progress_file, 'w') as f:
-                json.dump({'downloaded': list(self._downloaded_sids)}, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving progress: {e}")
+        Each folder is read once with os.scandir, so resume checks are set
+        lookups instead of one stat() per memory.
+        
+        Returns:
+            Set of file paths, in the same form as _dest_path returns
+        """
+        existing: Set[str] = set()
+        for folder in (self.output_dir, self.output_dir / "images", self.output_dir / "videos"):
+            try:
+                with os.scandir(folder) as entries:
+                    existing.update(entry.path for entry in entries if entry.is_file())
+            except FileNotFoundError:
+                continue
+        return existing
+    
+    def is_pending(self, memory: Dict, existing_files: Set[str]) -> bool:
+        """Check whether a memory still needs to be downloaded.
+        
+        Args:
+            memory: Memory dictionary with download info
+            existing_files: Result of scan_existing_files()
+            
+        Returns:
+            True if the memory is neither recorded as downloaded nor on disk
+        """
+        if self.is_downloaded(memory['sid']):
+            return False
+        return str(self._dest_path(memory)) not in existing_files
     
     def is_downloaded(self, sid: str) -> bool:
         """Check if a file has already been downloaded.
@@ -222,6 +385,10 @@ class DownloadCore:
     def download_memory(self, memory: Dict) -> Tuple[bool, str]:
         """Download a single memory file.
         
+        Runs ``fetch_memory`` and then ``finish_memory``. Callers that limit
+        requests per host can call the two steps themselves, so the limit
+        only covers the network transfer.
+        
         Args:
             memory: Memory dictionary with download info
             
@@ -232,32 +399,87 @@ class DownloadCore:
         
         # Check if already downloaded
         if self.is_downloaded(sid):
-            logger.debug(f"Skipping {sid} - already downloaded")
+            logger.debug("Skipping %s - already downloaded", sid)
             return True, "Already downloaded"
         
+        temp_file, message = self.fetch_memory(memory)
+        if temp_file is None:
+            return False, message
+        return self.finish_memory(memory, temp_file)
+    
+    def fetch_memory(self, memory: Dict) -> Tuple[Optional[Path], str]:
+        """Download a memory's file body to a temporary file.
+        
+        Failures are counted in the progress statistics.
+        
+        Args:
+            memory: Memory dictionary with download info
+            
+        Returns:
+            (temp_file, message) tuple; temp_file is None if the download
+            failed, with the reason in message
+        """
+        sid = memory['sid']
+        
         try:
             # Download the file
-            logger.info(f"Downloading {memory['filename']}...")
-            response = self.session.get(memory['download_url'], timeout=60)
-            
-            # Check for errors
-            if response.status_code == 429:
-                logger.warning("Rate limited by server")
-                return False, "Rate limited - try again later"
-            
-            response.raise_for_status()
+            logger.info("Downloading %s...", memory['filename'])
+            temp_file = self.output_dir / f"temp_{sid}.download"
             
-            # Check content type
-            content_type = response.headers.get('content-type', '')
-            if 'text/html' in content_type:
-                logger.error("Received HTML instead of media file")
-                return False, "Server error - received HTML"
+            # Stream the body to disk so memory use stays at one chunk per
+            # download instead of the whole file
+            with self.session.get(
+                memory['download_url'], timeout=60, stream=True
+            ) as response:
+                # Check for errors
+                if response.status_code == 429:
+                    logger.warning("Rate limited by server")
+                    return None, "Rate limited - try again later"
+                
+                response.raise_for_status()
+                
+                # Check content type
+                content_type = response.headers.get('content-type', '')
+                if 'text/html' in content_type:
+                    logger.error("Received HTML instead of media file")
+                    return None, "Server error - received HTML"
+                
+                # Save to temporary file
+                try:
+                    with open(temp_file, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                            f.write(chunk)
+                except BaseException:
+                    temp_file.unlink(missing_ok=True)
+                    raise
             
-            # Save to temporary file
-            temp_file = self.output_dir / f"temp_{sid}.download"
-            with open(temp_file, 'wb') as f:
-                f.write(response.content)
+            return temp_file, ""
+                
+        except requests.RequestException as e:
+            logger.error("Download error for %s: %s", sid, e)
+            self._count('failed_files')
+            return None, f"Network error: {str(e)}"
+        except Exception as e:
+            logger.error("Unexpected error for %s: %s", sid, e)
+            self._count('failed_files')
+            return None, f"Error: {str(e)}"
+    
+    def finish_memory(self, memory: Dict, temp_file: Path) -> Tuple[bool, str]:
+        """Turn a fetched temporary file into the final media file.
+        
+        Extracts or renames the file into place, embeds GPS data when an
+        ExifTool service is set, and records the memory as downloaded.
+        
+        Args:
+            memory: Memory dictionary with download info
+            temp_file: Temporary file returned by ``fetch_memory``
             
+        Returns:
+            (success, message) tuple
+        """
+        sid = memory['sid']
+        
+        try:
             # Process the file
             if zipfile.is_zipfile(temp_file):
                 success = self._extract_zip(temp_file, memory, sid)
@@ -269,23 +491,84 @@ class DownloadCore:
                 temp_file.unlink()
             
             if success:
+                if self.exiftool is not None:
+                    self._embed_gps(memory)
                 self.save_progress(sid)
-                self.progress.downloaded_files += 1
-                logger.info(f"Successfully downloaded {memory['filename']}")
+                self._count('downloaded_files')
+                logger.info("Successfully downloaded %s", memory['filename'])
                 return True, "Downloaded"
             else:
-                self.progress.failed_files += 1
+                self._count('failed_files')
                 return False, "Processing failed"
                 
-        except requests.RequestException as e:
-            logger.error(f"Download error for {sid}: {e}")
-            self.progress.failed_files += 1
-            return False, f"Network error: {str(e)}"
         except Exception as e:
-            logger.error(f"Unexpected error for {sid}: {e}")
-            self.progress.failed_files += 1
+            logger.error("Unexpected error for %s: %s", sid, e)
+            self._count('failed_files')
             return False, f"Error: {str(e)}"
     
+    def _count(self, field: str):
+        """Increment a progress counter safely across download threads.
+        
+        Args:
+            field: Name of the DownloadProgress counter to increment
+        """
+        with self._lock:
+            setattr(self.progress, field, getattr(self.progress, field) + 1)
+    
+    def _dest_path(self, memory: Dict) -> Path:
+        """Get the final path of a memory's media file.
+        
+        Args:
+            memory: Memory metadata
+            
+        Returns:
+            Path inside images/, videos/ or the output folder
+        """
+        media_type = memory['media_type']
+        if media_type == 'image':
+            dest_dir = self.output_dir / "images"
+        elif media_type == 'video':
+            dest_dir = self.output_dir / "videos"
+        else:
+            dest_dir = self.output_dir
+        return dest_dir / memory['filename']
+    
+    def _embed_gps(self, memory: Dict):
+        """Write a memory's location into its saved media file.
+        
+        Args:
+            memory: Memory metadata with a 'location' string
+        """
+        match = GPS_PATTERN.search(memory.get('location') or '')
+        if not match:
+            return
+        
+        latitude, longitude = float(match.group(1)), float(match.group(2))
+        if latitude == 0.0 and longitude == 0.0:
+            return  # Snapchat uses 0, 0 for memories without a location
+        
+        try:
+            self.exiftool.write_gps(self._dest_path(memory), latitude, longitude)
+        except Exception as e:
+            logger.warning("GPS embedding failed for %s: %s", memory['filename'], e)
+    
+    def _copy_stream(self, src, dst):
+        """Copy a binary stream through this thread's reusable buffer.
+        
+        Args:
+            src: Readable binary file object supporting readinto()
+            dst: Writable binary file object
+        """
+        buffer = getattr(self._buffers, 'buffer', None)
+        if buffer is None:
+            buffer = self._buffers.buffer = memoryview(bytearray(DOWNLOAD_BUFFER_SIZE))
+        
+        while True:
+            count = src.readinto(buffer)
+            if not count:
+                break
+            dst.write(buffer[:count])
+    
     def _extract_zip(self, zip_path: Path, memory: Dict, sid: str) -> bool:
         """Extract and save media from ZIP file.
         
@@ -299,40 +582,32 @@ class DownloadCore:
         """
         try:
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Extract to temp directory
-                temp_dir = self.output_dir / f"temp_{sid}_extract"
-                zip_ref.extractall(temp_dir)
-                
-                # Find the media file (usually the largest file)
-                media_files = list(temp_dir.glob('*'))
-                if not media_files:
-                    logger.warning(f"No files found in ZIP for {sid}")
+                # The media file is usually the largest member. Only that
+                # member is written, straight into its destination folder.
+                members = [info for info in zip_ref.infolist() if not info.is_dir()]
+                if not members:
+                    logger.warning("No files found in ZIP for %s", sid)
                     return False
                 
-                # Sort by size, take largest
-                media_file = max(media_files, key=lambda p: p.stat().st_size)
+                media_info = max(members, key=lambda info: info.file_size)
                 
-                # Move to appropriate directory
-                media_type = memory['media_type']
-                if media_type == 'image':
-                    dest_dir = self.output_dir / "images"
-                elif media_type == 'video':
-                    dest_dir = self.output_dir / "videos"
-                else:
-                    dest_dir = self.output_dir
+                # Write under a temporary name so an interrupted extraction
+                # never leaves a truncated file under the final name
+                dest_file = self._dest_path(memory)
+                part_file = dest_file.with_name(f"{dest_file.name}.part")
+                try:
+                    with zip_ref.open(media_info) as src, open(part_file, 'wb') as dst:
+                        self._copy_stream(src, dst)
+                    part_file.replace(dest_file)
+                except BaseException:
+                    part_file.unlink(missing_ok=True)
+                    raise
                 
-                dest_file = dest_dir / memory['filename']
-                media_file.rename(dest_file)
-                
-                # Clean up temp directory
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                
-                logger.debug(f"Extracted ZIP to {dest_file}")
+                logger.debug("Extracted ZIP to %s", dest_file)
                 return True
                 
         except Exception as e:
-            logger.error(f"Error extracting ZIP for {sid}: {e}")
+            logger.error("Error extracting ZIP for %s: %s", sid, e)
             return False
     
     def _save_media(self, temp_file: Path, memory: Dict, sid: str) -> bool:
@@ -347,20 +622,12 @@ class DownloadCore:
             True if successful
         """
         try:
-            media_type = memory['media_type']
-            if media_type == 'image':
-                dest_dir = self.output_dir / "images"
-            elif media_type == 'video':
-                dest_dir = self.output_dir / "videos"
-            else:
-                dest_dir = self.output_dir
-            
-            dest_file = dest_dir / memory['filename']
+            dest_file = self._dest_path(memory)
             temp_file.rename(dest_file)
             
-            logger.debug(f"Saved media to {dest_file}")
+            logger.debug("Saved media to %s", dest_file)
             return True
             
         except Exception as e:
-            logger.error(f"Error saving media for {sid}: {e}")
+            logger.error("Error saving media for %s: %s", sid, e)
             return False
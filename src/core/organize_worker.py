@@ -4,12 +4,14 @@ This module provides the OrganizeWorker class that runs the organization
 process in a separate thread to avoid blocking the UI.
 """
 
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from PySide6.QtCore import QThread, Signal, Slot
 
 from .organizer import OrganizerCore
+from ..utils.config import PROGRESS_UPDATE_INTERVAL
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -20,17 +22,48 @@ class OrganizeWorker(QThread):
     
     Signals:
         progress_updated: (current, total, status) - Progress update
-        stats_updated: (stats_dict) - Statistics update
+        stats_updated: (total, organized, unmatched, low_confidence,
+            exact_media_id, fuzzy_media_id, time_based) - Statistics update
         finished: (success, message) - Organization completed
         error: (error_message) - Error occurred
     """
     
     progress_updated = Signal(int, int, str)  # current, total, status
-    stats_updated = Signal(dict)  # statistics dictionary
+    stats_updated = Signal(int, int, int, int, int, int, int)  # statistics counters
     finished = Signal(bool, str)  # success, message
     error = Signal(str)  # error message
     
-    def __init__(
+    def __init__(self, parent=None):
+        """Initialize the organize worker.
+        
+        The worker is reusable: call ``configure`` with the settings for
+        each run before calling ``start``.
+        
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        
+        self.export_path: Optional[Path] = None
+        self.output_path: Optional[Path] = None
+        self.timestamp_threshold = 7200
+        self.match_score_threshold = 0.45
+        self.enable_tier1 = True
+        self.enable_tier2 = True
+        self.enable_tier3 = True
+        self.organize_by_year = True
+        self.create_debug_report = True
+        self.preserve_originals = True
+        
+        self.organizer: Optional[OrganizerCore] = None
+        self._last_progress_value = -1
+        self._last_progress_emit = 0.0
+        # Last update dropped by the throttle, sent before the next change
+        self._pending_progress: Optional[Tuple[int, int, str]] = None
+        
+        logger.debug("OrganizeWorker initialized")
+    
+    def configure(
         self,
         export_path: Path,
         output_path: Path,
@@ -42,9 +75,10 @@ class OrganizeWorker(QThread):
         organize_by_year: bool = True,
         create_debug_report: bool = True,
         preserve_originals: bool = True,
-        parent=None,
     ):
-        """Initialize the organize worker.
+        """Set the configuration for the next run and reset per-run state.
+        
+        Must not be called while the worker is running.
         
         Args:
             export_path: Path to Snapchat export folder
@@ -57,10 +91,7 @@ class OrganizeWorker(QThread):
             organize_by_year: Create year subdirectories
             create_debug_report: Generate detailed matching report
             preserve_originals: Create .snapchat_original sidecar files
-            parent: Parent QObject
         """
-        super().__init__(parent)
-        
         self.export_path = Path(export_path)
         self.output_path = Path(output_path)
         self.timestamp_threshold = timestamp_threshold
@@ -72,9 +103,10 @@ class OrganizeWorker(QThread):
         self.create_debug_report = create_debug_report
         self.preserve_originals = preserve_originals
         
-        self.organizer: Optional[OrganizerCore] = None
-        
-        logger.debug("OrganizeWorker initialized")
+        self.organizer = None
+        self._last_progress_value = -1
+        self._last_progress_emit = 0.0
+        self._pending_progress = None
     
     def run(self):
         """Run the organization process in background thread."""
@@ -98,9 +130,10 @@ class OrganizeWorker(QThread):
             
             # Run organization
             success = self.organizer.organize()
+            self._flush_pending_progress()
             
             # Emit final statistics
-            self.stats_updated.emit(self.organizer.stats)
+            self._emit_stats()
             
             if success:
                 message = self._format_success_message()
@@ -127,16 +160,56 @@ class OrganizeWorker(QThread):
     def _on_progress(self, current: int, total: int, status: str):
         """Handle progress updates from organizer.
         
+        Updates that only change the status text are throttled to one per
+        PROGRESS_UPDATE_INTERVAL, so fast runs don't queue more signals than
+        the UI can show. A change of the progress value is always sent,
+        preceded by the last update the throttle dropped, so a phase's
+        status text is never lost.
+        
         Args:
             current: Current progress value
             total: Total progress value
             status: Status message
         """
+        now = time.monotonic()
+        if current == self._last_progress_value:
+            if now - self._last_progress_emit < PROGRESS_UPDATE_INTERVAL / 1000:
+                self._pending_progress = (current, total, status)
+                return
+        else:
+            self._flush_pending_progress()
+        self._pending_progress = None
+        self._last_progress_value = current
+        self._last_progress_emit = now
+        
         self.progress_updated.emit(current, total, status)
         
         # Emit stats update periodically
         if self.organizer and current % 20 == 0:
-            self.stats_updated.emit(self.organizer.stats)
+            self._emit_stats()
+    
+    def _flush_pending_progress(self):
+        """Send the last progress update dropped by the throttle, if any."""
+        if self._pending_progress is not None:
+            self.progress_updated.emit(*self._pending_progress)
+            self._pending_progress = None
+    
+    def _emit_stats(self):
+        """Emit a snapshot of the organizer's statistics counters.
+        
+        The counters are sent as plain ints rather than the organizer's
+        stats dict, which the worker keeps updating while the UI reads it.
+        """
+        stats = self.organizer.stats
+        self.stats_updated.emit(
+            stats.get("total", 0),
+            stats.get("organized", 0),
+            stats.get("unmatched", 0),
+            stats.get("low_confidence", 0),
+            stats.get("exact_media_id", 0),
+            stats.get("fuzzy_media_id", 0),
+            stats.get("time_based", 0),
+        )
     
     def _format_success_message(self) -> str:
         """Format success message with statistics.
@@ -5,13 +5,14 @@ chat media files by contact using a probabilistic scoring-based matching strateg
 """
 
 import json
+import os
 import shutil
 import re
 import hashlib
 import math
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Callable, Tuple
+from typing import Dict, List, Optional, Callable, Set, Tuple
 from collections import defaultdict
 
 from ..utils.logger import get_logger
@@ -84,6 +85,9 @@ class OrganizerCore:
             "time_based": 0,
         }
         
+        # Target folders already created this run, so each is made only once
+        self._created_dirs: Set[Path] = set()
+        
         self._cancelled = False
         
         logger.info(f"Organizer initialized: {export_path} -> {output_path}")
@@ -119,8 +123,12 @@ class OrganizerCore:
             self._report_progress(15, 100, "Counting media files...")
             all_files = []
             for media_dir in media_dirs:
-                files = list(Path(media_dir).glob("*"))
-                all_files.extend([f for f in files if f.is_file()])
+                # scandir reports the entry type with the listing, so files
+                # are told apart from folders without a stat per entry
+                with os.scandir(media_dir) as entries:
+                    all_files.extend(
+                        Path(entry.path) for entry in entries if entry.is_file()
+                    )
             
             self.stats["total"] = len(all_files)
             logger.info(f"Found {self.stats['total']} total media files")
@@ -203,10 +211,11 @@ class OrganizerCore:
         Returns:
             List of Path objects for media directories
         """
-        media_dirs = sorted([
-            d for d in self.export_path.glob("chat_media*")
-            if d.is_dir()
-        ])
+        with os.scandir(self.export_path) as entries:
+            media_dirs = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.startswith("chat_media") and entry.is_dir()
+            )
         return media_dirs
     
     def _process_files(self, files: List[Path]) -> bool:
@@ -388,6 +397,16 @@ class OrganizerCore:
         
         return True
     
+    def _ensure_dir(self, path: Path):
+        """Create a target folder unless it was already created this run.
+        
+        Args:
+            path: Folder to create
+        """
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+    
     def _copy_to_contact(self, media_file: Path, info: Dict):
         """Copy file to contact's organized folder (legacy method for backwards compatibility).
         
@@ -404,7 +423,7 @@ class OrganizerCore:
         else:
             target_dir = self.output_path / contact_name
         
-        target_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(target_dir)
         
         # Determine extension
         ext = media_file.suffix
@@ -450,7 +469,7 @@ class OrganizerCore:
         else:
             target_dir = self.output_path / contact_name
         
-        target_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(target_dir)
         
         # Determine extension
         ext = media_file.suffix
@@ -0,0 +1,63 @@
+"""
+Rate Limiter Module
+
+This module provides a thread-safe token bucket used to cap the request
+rate of concurrent downloads without serializing them.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Thread-safe token bucket rate limiter.
+    
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    Each request takes one token, so callers only wait when the
+    aggregate rate would otherwise be exceeded.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the rate limiter.
+        
+        Args:
+            rate: Maximum sustained requests per second (must be positive)
+            burst: Maximum number of requests allowed back to back
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, cancel_event: Optional[threading.Event] = None) -> bool:
+        """Take one token, waiting for it to become available if needed.
+        
+        Args:
+            cancel_event: Event that aborts the wait when set (optional)
+        
+        Returns:
+            True once a token was taken, False if cancelled while waiting
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                
+                wait_time = (1 - self._tokens) / self.rate
+            
+            if cancel_event is None:
+                time.sleep(wait_time)
+            elif cancel_event.wait(wait_time):
+                return False
@@ -10,11 +10,13 @@ This module provides the backend implementation for various utility tools:
 """
 
 import hashlib
+import os
 import shutil
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from PIL import Image
 import piexif
@@ -118,19 +120,22 @@ class ToolsCore:
         files = self._get_media_files()
         results['total_files'] = len(files)
         
-        # Calculate hashes and detect duplicates
+        # Calculate hashes and detect duplicates. file_digest releases the
+        # GIL while hashing, so files are hashed on one thread per CPU.
+        # map() keeps the input order, so the first copy found is kept.
         hash_to_files: Dict[str, List[Path]] = defaultdict(list)
         
-        for i, file_path in enumerate(files):
-            if self._cancelled:
-                logger.info("Duplicate detection cancelled")
-                break
-            
-            try:
-                file_hash = self._calculate_file_hash(file_path)
-                hash_to_files[file_hash].append(file_path)
-            except Exception as e:
-                logger.error(f"Failed to hash {file_path}: {e}")
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        try:
+            for file_path, file_hash in zip(files, executor.map(self._try_hash, files)):
+                if self._cancelled:
+                    logger.info("Duplicate detection cancelled")
+                    break
+                
+                if file_hash is not None:
+                    hash_to_files[file_hash].append(file_path)
+        finally:
+            executor.shutdown(cancel_futures=True)
         
         # Create duplicates folder
         duplicates_folder = self.target_folder / "duplicates"
@@ -206,10 +211,11 @@ class ToolsCore:
                 year = self._get_file_year(file_path)
                 
                 if year:
-                    # Create year folder if it doesn't exist
+                    # Create each year folder once rather than per file
                     year_folder = self.target_folder / str(year)
-                    year_folder.mkdir(exist_ok=True)
-                    year_folders.add(str(year))
+                    if str(year) not in year_folders:
+                        year_folder.mkdir(exist_ok=True)
+                        year_folders.add(str(year))
                     
                     # Move file to year folder
                     dest_path = year_folder / file_path.name
@@ -365,14 +371,26 @@ class ToolsCore:
         Returns:
             Hexadecimal hash string
         """
-        sha256_hash = hashlib.sha256()
-        
         with open(file_path, "rb") as f:
-            # Read in chunks for memory efficiency
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    
+    def _try_hash(self, file_path: Path) -> Optional[str]:
+        """Calculate a file's hash, logging instead of raising on failure.
         
-        return sha256_hash.hexdigest()
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Hexadecimal hash string, or None if the file could not be read
+            or the operation was cancelled
+        """
+        if self._cancelled:
+            return None
+        try:
+            return self._calculate_file_hash(file_path)
+        except Exception as e:
+            logger.error(f"Failed to hash {file_path}: {e}")
+            return None
     
     def _get_file_year(self, file_path: Path) -> Optional[int]:
         """Get the year from a file's EXIF or creation date.
@@ -7,7 +7,7 @@ without blocking the UI, with progress reporting and cancellation support.
 from pathlib import Path
 from typing import Dict, Optional
 
-from PySide6.QtCore import QThread, Signal, Slot
+from PySide6.QtCore import QThread, Signal
 
 from .tools_core import ToolsCore
 from ..utils.logger import get_logger
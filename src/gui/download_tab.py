@@ -8,15 +8,17 @@ This tab provides UI for:
 - Cancel functionality
 """
 
-from typing import Optional
+import logging
+import os
+from typing import Dict, Optional
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
+    QFormLayout,
     QGroupBox,
-    QLabel,
     QLineEdit,
     QPushButton,
     QFileDialog,
@@ -25,7 +27,7 @@ from PySide6.QtWidgets import (
     QCheckBox,
     QMessageBox,
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import QThreadPool, QTimer, Signal, Slot
 
 from .progress_widget import ProgressWidget
 from ..core.download_worker import DownloadWorker
@@ -33,6 +35,13 @@ from ..utils.config import (
     DEFAULT_DOWNLOAD_DELAY,
     MIN_DOWNLOAD_DELAY,
     MAX_DOWNLOAD_DELAY,
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    MIN_DOWNLOAD_CONCURRENCY,
+    MAX_DOWNLOAD_CONCURRENCY,
+    PER_HOST_DOWNLOAD_LIMIT,
+    PROGRESS_UPDATE_INTERVAL,
+    load_settings,
+    save_settings,
 )
 from ..utils.logger import get_logger
 
@@ -51,6 +60,7 @@ class DownloadTab(QWidget):
     download_started = Signal()
     download_completed = Signal()
     download_cancelled = Signal()
+    _suggested_output_ready = Signal(str, bool)  # path, usable
     
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize the download tab.
@@ -61,16 +71,52 @@ class DownloadTab(QWidget):
         super().__init__(parent)
         
         self._is_downloading = False
-        self._download_worker: Optional[DownloadWorker] = None
         
-        self._setup_ui()
+        # A single worker is reused for every download run
+        self._download_worker = DownloadWorker()
+        self._download_worker.progress_updated.connect(self._on_progress_updated)
+        self._download_worker.status_message.connect(self._on_status_message)
+        self._download_worker.file_downloaded.connect(self._on_file_downloaded)
+        self._download_worker.finished.connect(self._on_download_finished)
+        self._download_worker.error.connect(self._on_download_error)
+        
+        self._suggested_output_ready.connect(self._on_suggested_output_ready)
+        
+        # File dialogs are created on first browse and then reused
+        self._html_file_dialog: Optional[QFileDialog] = None
+        self._output_folder_dialog: Optional[QFileDialog] = None
+        # Folders the file dialogs last opened in, from the config file
+        self._last_paths: Dict[str, str] = dict(load_settings()['last_paths'])
+        
+        # Message boxes by icon, created on first use and then reused
+        self._message_boxes: Dict[QMessageBox.Icon, QMessageBox] = {}
+        
+        # Configuration values, kept current by the widgets' change signals
+        self._config_cache: dict = {}
+        self._config_snapshot: Optional[dict] = None
+        
+        # The tab contents are built on first show
+        self._ui_built = False
+        self._layout = QVBoxLayout(self)
+        self._layout.setSpacing(20)
+        self._layout.setContentsMargins(30, 25, 30, 25)
+        
         logger.debug("Download tab initialized")
     
-    def _setup_ui(self):
+    def showEvent(self, event):
+        """Build the user interface the first time the tab is shown.
+        
+        Args:
+            event: Show event
+        """
+        if not self._ui_built:
+            self._setup_ui_lazy()
+            self._ui_built = True
+        super().showEvent(event)
+    
+    def _setup_ui_lazy(self):
         """Set up the user interface."""
-        layout = QVBoxLayout(self)
-        layout.setSpacing(20)
-        layout.setContentsMargins(30, 25, 30, 25)
+        layout = self._layout
         
         # File selection group
         file_group = self._create_file_selection_group()
@@ -89,6 +135,14 @@ class DownloadTab(QWidget):
         self.progress_widget.cancel_requested.connect(self._on_cancel_requested)
         layout.addWidget(self.progress_widget)
         
+        # Progress updates arrive once per file; the timer coalesces them so
+        # the progress widget repaints at most once per interval
+        self._pending_progress = None
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setSingleShot(True)
+        self._ui_timer.setInterval(PROGRESS_UPDATE_INTERVAL)
+        self._ui_timer.timeout.connect(self._flush_progress)
+        
         # Add stretch to push everything to top
         layout.addStretch()
     
@@ -100,39 +154,39 @@ class DownloadTab(QWidget):
         """
         group = QGroupBox("📄 File Selection")
         group.setProperty("class", "StyledGroupBox")
-        layout = QVBoxLayout(group)
+        layout = QFormLayout(group)
         layout.setSpacing(12)
         layout.setContentsMargins(15, 20, 15, 15)
         
         # HTML file selector
         html_layout = QHBoxLayout()
-        html_layout.addWidget(QLabel("HTML File:"))
         
         self.html_path_edit = QLineEdit()
         self.html_path_edit.setPlaceholderText("Select memories_history.html from your Snapchat export...")
         self.html_path_edit.setReadOnly(True)
+        self._bind_config('html_path', self.html_path_edit.textChanged, self.html_path_edit.text())
         html_layout.addWidget(self.html_path_edit, stretch=1)
         
         self.browse_html_btn = QPushButton("Browse...")
         self.browse_html_btn.clicked.connect(self._browse_html_file)
         html_layout.addWidget(self.browse_html_btn)
         
-        layout.addLayout(html_layout)
+        layout.addRow("HTML File:", html_layout)
         
         # Output folder selector
         output_layout = QHBoxLayout()
-        output_layout.addWidget(QLabel("Output Folder:"))
         
         self.output_path_edit = QLineEdit()
         self.output_path_edit.setPlaceholderText("Select output folder for downloaded memories...")
         self.output_path_edit.setReadOnly(True)
+        self._bind_config('output_path', self.output_path_edit.textChanged, self.output_path_edit.text())
         output_layout.addWidget(self.output_path_edit, stretch=1)
         
         self.browse_output_btn = QPushButton("Browse...")
         self.browse_output_btn.clicked.connect(self._browse_output_folder)
         output_layout.addWidget(self.browse_output_btn)
         
-        layout.addLayout(output_layout)
+        layout.addRow("Output Folder:", output_layout)
         
         return group
     
@@ -148,29 +202,45 @@ class DownloadTab(QWidget):
         layout.setSpacing(12)
         layout.setContentsMargins(15, 20, 15, 15)
         
-        # Delay configuration
-        delay_layout = QHBoxLayout()
-        delay_layout.addWidget(QLabel("Delay between requests:"))
+        # Request settings; the spin boxes keep their natural width
+        form_layout = QFormLayout()
+        form_layout.setSpacing(12)
+        form_layout.setFieldGrowthPolicy(QFormLayout.FieldsStayAtSizeHint)
         
+        # Delay configuration
         self.delay_spinbox = QDoubleSpinBox()
         self.delay_spinbox.setMinimum(MIN_DOWNLOAD_DELAY)
         self.delay_spinbox.setMaximum(MAX_DOWNLOAD_DELAY)
         self.delay_spinbox.setValue(DEFAULT_DOWNLOAD_DELAY)
         self.delay_spinbox.setSingleStep(0.5)
         self.delay_spinbox.setSuffix(" seconds")
+        self._bind_config('delay', self.delay_spinbox.valueChanged, self.delay_spinbox.value())
         self.delay_spinbox.setToolTip(
-            "Time to wait between download requests to avoid rate limiting"
+            "Time to wait between download requests to avoid rate limiting; "
+            "applies to all parallel downloads together"
         )
-        delay_layout.addWidget(self.delay_spinbox)
+        form_layout.addRow("Delay between requests:", self.delay_spinbox)
+        
+        # Concurrency configuration
+        self.concurrency_spinbox = QSpinBox()
+        self.concurrency_spinbox.setMinimum(MIN_DOWNLOAD_CONCURRENCY)
+        self.concurrency_spinbox.setMaximum(MAX_DOWNLOAD_CONCURRENCY)
+        self.concurrency_spinbox.setValue(DEFAULT_DOWNLOAD_CONCURRENCY)
+        self._bind_config('max_concurrency', self.concurrency_spinbox.valueChanged, self.concurrency_spinbox.value())
+        self.concurrency_spinbox.setToolTip(
+            "Number of memories downloaded in parallel (request rate is still "
+            "limited by the delay setting)"
+        )
+        form_layout.addRow("Concurrent downloads:", self.concurrency_spinbox)
         
-        delay_layout.addStretch()
-        layout.addLayout(delay_layout)
+        layout.addLayout(form_layout)
         
         layout.addSpacing(5)
         
         # Feature toggles
         self.embed_gps_checkbox = QCheckBox("Embed GPS metadata")
         self.embed_gps_checkbox.setChecked(True)
+        self._bind_config('embed_gps', self.embed_gps_checkbox.toggled, self.embed_gps_checkbox.isChecked())
         self.embed_gps_checkbox.setToolTip(
             "Embed GPS coordinates from Snapchat data into file metadata (requires ExifTool)"
         )
@@ -178,6 +248,7 @@ class DownloadTab(QWidget):
         
         self.apply_overlays_checkbox = QCheckBox("Apply overlays")
         self.apply_overlays_checkbox.setChecked(False)
+        self._bind_config('apply_overlays', self.apply_overlays_checkbox.toggled, self.apply_overlays_checkbox.isChecked())
         self.apply_overlays_checkbox.setToolTip(
             "Composite Snapchat overlays onto images and videos (requires Pillow and FFmpeg)"
         )
@@ -185,6 +256,7 @@ class DownloadTab(QWidget):
         
         self.convert_timezone_checkbox = QCheckBox("Convert timezone")
         self.convert_timezone_checkbox.setChecked(False)
+        self._bind_config('convert_timezone', self.convert_timezone_checkbox.toggled, self.convert_timezone_checkbox.isChecked())
         self.convert_timezone_checkbox.setToolTip(
             "Convert timestamps from UTC to GPS-based local timezone"
         )
@@ -192,6 +264,7 @@ class DownloadTab(QWidget):
         
         self.organize_by_year_checkbox = QCheckBox("Organize by year")
         self.organize_by_year_checkbox.setChecked(True)
+        self._bind_config('organize_by_year', self.organize_by_year_checkbox.toggled, self.organize_by_year_checkbox.isChecked())
         self.organize_by_year_checkbox.setToolTip(
             "Organize files into year-based subdirectories (e.g., 2023/, 2024/)"
         )
@@ -221,116 +294,196 @@ class DownloadTab(QWidget):
         
         return layout
     
+    def _get_html_file_dialog(self) -> QFileDialog:
+        """Get the HTML file dialog, creating it on first use.
+        
+        The dialog is kept for the lifetime of the tab so later browses
+        reuse its already populated file system model.
+        
+        Returns:
+            QFileDialog for selecting the memories HTML file
+        """
+        if self._html_file_dialog is None:
+            # Reopen where the last export was picked. Otherwise start in
+            # Downloads, where exports usually land, rather than listing the
+            # whole home folder.
+            start_dir = self._last_paths.get('download_html')
+            if not start_dir:
+                start_dir = Path.home() / "Downloads"
+                if not start_dir.is_dir():
+                    start_dir = Path.home()
+            
+            dialog = QFileDialog(
+                self,
+                "Select Snapchat Memories HTML File",
+                str(start_dir),
+                "HTML Files (*.html);;All Files (*.*)",
+            )
+            dialog.setFileMode(QFileDialog.ExistingFile)
+            # Prefer the platform picker over Qt's widget-based dialog, which
+            # enumerates large export folders on the GUI thread
+            dialog.setOption(QFileDialog.DontUseNativeDialog, False)
+            dialog.setOption(QFileDialog.DontUseCustomDirectoryIcons)
+            dialog.setOption(QFileDialog.DontResolveSymlinks)
+            self._html_file_dialog = dialog
+        return self._html_file_dialog
+    
+    def _get_output_folder_dialog(self) -> QFileDialog:
+        """Get the output folder dialog, creating it on first use.
+        
+        Returns:
+            QFileDialog for selecting the output folder
+        """
+        if self._output_folder_dialog is None:
+            start_dir = self._last_paths.get('download_output') or str(Path.home())
+            dialog = QFileDialog(self, "Select Output Folder", start_dir)
+            dialog.setFileMode(QFileDialog.Directory)
+            dialog.setOption(QFileDialog.ShowDirsOnly)
+            dialog.setOption(QFileDialog.DontUseCustomDirectoryIcons)
+            dialog.setOption(QFileDialog.DontResolveSymlinks)
+            self._output_folder_dialog = dialog
+        return self._output_folder_dialog
+    
     @Slot()
     def _browse_html_file(self):
         """Browse for HTML file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Snapchat Memories HTML File",
-            str(Path.home()),
-            "HTML Files (*.html);;All Files (*.*)",
-        )
+        dialog = self._get_html_file_dialog()
+        if not dialog.exec():
+            return
         
+        file_path = dialog.selectedFiles()[0]
         if file_path:
-            self.html_path_edit.setText(file_path)
-            logger.info(f"HTML file selected: {file_path}")
+            # Skip redundant setText calls and their textChanged signals
+            if self._config_cache['html_path'] != file_path:
+                self.html_path_edit.setText(file_path)
+            logger.info("HTML file selected: %s", file_path)
+            self._remember_path('download_html', str(Path(file_path).parent))
             
-            # Auto-suggest output folder based on HTML location
-            if not self.output_path_edit.text():
+            # Auto-suggest output folder based on HTML location. The folder
+            # is probed on a pool thread since the export may be on slow storage.
+            if not self._config_cache['output_path']:
                 suggested_output = Path(file_path).parent.parent / "memories"
-                self.output_path_edit.setText(str(suggested_output))
+                QThreadPool.globalInstance().start(
+                    lambda: self._probe_output(suggested_output)
+                )
+    
+    def _probe_output(self, path: Path):
+        """Check whether a suggested output folder is usable.
+        
+        Runs on a QThreadPool thread and reports the result through
+        ``_suggested_output_ready``.
+        
+        Args:
+            path: Suggested output folder
+        """
+        if path.exists():
+            usable = path.is_dir() and os.access(path, os.W_OK)
+        else:
+            usable = os.access(path.parent, os.W_OK)
+        self._suggested_output_ready.emit(str(path), usable)
+    
+    @Slot(str, bool)
+    def _on_suggested_output_ready(self, path: str, usable: bool):
+        """Apply a probed output folder suggestion.
+        
+        Args:
+            path: Suggested output folder
+            usable: Whether the folder exists and is writable, or can be created
+        """
+        if usable and not self._config_cache['output_path']:
+            self.output_path_edit.setText(path)
     
     @Slot()
     def _browse_output_folder(self):
         """Browse for output folder."""
-        folder_path = QFileDialog.getExistingDirectory(
-            self,
-            "Select Output Folder",
-            self.output_path_edit.text() or str(Path.home()),
-        )
+        dialog = self._get_output_folder_dialog()
+        output_path = self._config_cache['output_path']
+        if output_path:
+            dialog.setDirectory(output_path)
+        if not dialog.exec():
+            return
         
+        folder_path = dialog.selectedFiles()[0]
         if folder_path:
-            self.output_path_edit.setText(folder_path)
-            logger.info(f"Output folder selected: {folder_path}")
+            if output_path != folder_path:
+                self.output_path_edit.setText(folder_path)
+            logger.info("Output folder selected: %s", folder_path)
+            self._remember_path('download_output', folder_path)
+    
+    def _remember_path(self, key: str, path: str):
+        """Store a browsed location in the config file's last_paths section.
+        
+        Args:
+            key: Entry in last_paths to update
+            path: Folder to reopen the matching dialog in next time
+        """
+        if self._last_paths.get(key) == path:
+            return
+        self._last_paths[key] = path
+        
+        settings = load_settings()
+        if not settings['general'].get('remember_last_paths', True):
+            return
+        settings['last_paths'][key] = path
+        save_settings(settings)
     
     @Slot()
     def _on_start_download(self):
         """Handle start download button click."""
+        config = self.get_configuration()
+        
         # Validate inputs
-        html_path = self.html_path_edit.text()
-        output_path = self.output_path_edit.text()
+        html_path = config['html_path']
+        output_path = config['output_path']
         
         if not html_path:
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Warning,
                 "Missing HTML File",
                 "Please select a Snapchat memories HTML file.",
             )
             return
         
-        if not Path(html_path).exists():
-            QMessageBox.warning(
-                self,
-                "File Not Found",
-                f"The HTML file does not exist:\n{html_path}",
-            )
-            return
-        
         if not output_path:
-            QMessageBox.warning(
-                self,
+            self._show_message(
+                QMessageBox.Warning,
                 "Missing Output Folder",
                 "Please select an output folder.",
             )
             return
         
-        # Create output directory if it doesn't exist
-        try:
-            Path(output_path).mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error Creating Output Folder",
-                f"Failed to create output folder:\n{str(e)}",
-            )
-            return
-        
         # Start download
-        logger.info("Starting download")
-        logger.info(f"  HTML file: {html_path}")
-        logger.info(f"  Output folder: {output_path}")
-        logger.info(f"  Delay: {self.delay_spinbox.value()}s")
-        logger.info(f"  GPS embedding: {self.embed_gps_checkbox.isChecked()}")
-        logger.info(f"  Apply overlays: {self.apply_overlays_checkbox.isChecked()}")
-        logger.info(f"  Convert timezone: {self.convert_timezone_checkbox.isChecked()}")
-        logger.info(f"  Organize by year: {self.organize_by_year_checkbox.isChecked()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Starting download")
+            logger.info("  HTML file: %s", html_path)
+            logger.info("  Output folder: %s", output_path)
+            logger.info("  Delay: %ss", config['delay'])
+            logger.info("  Concurrent downloads: %s", config['max_concurrency'])
+            logger.info("  GPS embedding: %s", config['embed_gps'])
+            logger.info("  Apply overlays: %s", config['apply_overlays'])
+            logger.info("  Convert timezone: %s", config['convert_timezone'])
+            logger.info("  Organize by year: %s", config['organize_by_year'])
         
         self._is_downloading = True
         self._set_ui_enabled(False)
         
-        # Get configuration
-        config = self.get_configuration()
-        
         # Create worker config
         worker_config = {
             'html_file': config['html_path'],
             'output_dir': config['output_path'],
             'delay': config['delay'],
+            'max_concurrency': config['max_concurrency'],
+            'per_host_limit': PER_HOST_DOWNLOAD_LIMIT,
             'gps_enabled': config['embed_gps'],
             'overlay_enabled': config['apply_overlays'],
             'timezone_enabled': config['convert_timezone'],
             'year_folders': config['organize_by_year'],
         }
         
-        # Create and configure worker
-        self._download_worker = DownloadWorker(worker_config)
-        
-        # Connect signals
-        self._download_worker.progress_updated.connect(self._on_progress_updated)
-        self._download_worker.status_message.connect(self._on_status_message)
-        self._download_worker.file_downloaded.connect(self._on_file_downloaded)
-        self._download_worker.finished.connect(self._on_download_finished)
-        self._download_worker.error.connect(self._on_download_error)
+        # Configure the worker; the previous run may still be unwinding
+        # after emitting finished
+        self._download_worker.wait()
+        self._download_worker.configure(worker_config)
         
         # Start progress widget
         self.progress_widget.start(100, "Starting download...")
@@ -345,7 +498,7 @@ class DownloadTab(QWidget):
         """Handle cancel request from progress widget."""
         logger.info("Download cancellation requested")
         
-        if not self._is_downloading or not self._download_worker:
+        if not self._is_downloading:
             return
         
         # Stop the worker
@@ -353,61 +506,128 @@ class DownloadTab(QWidget):
         
         # Worker will emit finished signal when it stops
     
+    def shutdown(self):
+        """Stop any running download and wait for the worker to exit."""
+        if self._download_worker.isRunning():
+            logger.info("Stopping download worker for shutdown")
+            self._download_worker.stop()
+        self._download_worker.wait()
+    
     @Slot()
     def _on_verify_downloads(self):
         """Handle verify downloads button click."""
         logger.info("Verify downloads requested")
-        QMessageBox.information(
-            self,
+        self._show_message(
+            QMessageBox.Information,
             "Verify Downloads",
             "Verification functionality will be implemented in the next phase.\n\n"
             "This will check all downloaded files for completeness and corruption.",
         )
     
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show a modal message box, reusing one dialog per icon.
+        
+        Args:
+            icon: Message box icon (Warning, Information or Critical)
+            title: Window title
+            text: Message text
+        """
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(icon, title, text, QMessageBox.Ok, self)
+            self._message_boxes[icon] = box
+        else:
+            box.setWindowTitle(title)
+            box.setText(text)
+        box.exec()
+    
     def _set_ui_enabled(self, enabled: bool):
         """Enable or disable UI controls.
         
         Args:
             enabled: True to enable, False to disable
         """
-        self.browse_html_btn.setEnabled(enabled)
-        self.browse_output_btn.setEnabled(enabled)
-        self.delay_spinbox.setEnabled(enabled)
-        self.embed_gps_checkbox.setEnabled(enabled)
-        self.apply_overlays_checkbox.setEnabled(enabled)
-        self.convert_timezone_checkbox.setEnabled(enabled)
-        self.organize_by_year_checkbox.setEnabled(enabled)
-        self.start_button.setEnabled(enabled)
-        self.verify_button.setEnabled(enabled)
+        # Batch the state changes into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.browse_html_btn.setEnabled(enabled)
+            self.browse_output_btn.setEnabled(enabled)
+            self.delay_spinbox.setEnabled(enabled)
+            self.concurrency_spinbox.setEnabled(enabled)
+            self.embed_gps_checkbox.setEnabled(enabled)
+            self.apply_overlays_checkbox.setEnabled(enabled)
+            self.convert_timezone_checkbox.setEnabled(enabled)
+            self.organize_by_year_checkbox.setEnabled(enabled)
+            self.start_button.setEnabled(enabled)
+            self.verify_button.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _bind_config(self, key: str, signal, initial):
+        """Track a configuration value in the cache.
+        
+        Args:
+            key: Configuration dictionary key
+            signal: Change signal of the widget holding the value
+            initial: Current value of the widget
+        """
+        self._config_cache[key] = initial
+        self._config_snapshot = None
+        signal.connect(lambda value: self._on_config_changed(key, value))
+    
+    def _on_config_changed(self, key: str, value):
+        """Store a changed configuration value and drop the snapshot.
+        
+        Args:
+            key: Configuration dictionary key
+            value: New widget value
+        """
+        self._config_cache[key] = value
+        self._config_snapshot = None
     
     def get_configuration(self) -> dict:
         """Get current download configuration.
         
+        The same dictionary is returned until a setting changes, so callers
+        must treat it as read-only.
+        
         Returns:
-            Dictionary with download configuration
+            Dictionary with download configuration, or an empty dictionary
+            if the tab has not been shown yet
         """
-        return {
-            'html_path': self.html_path_edit.text(),
-            'output_path': self.output_path_edit.text(),
-            'delay': self.delay_spinbox.value(),
-            'embed_gps': self.embed_gps_checkbox.isChecked(),
-            'apply_overlays': self.apply_overlays_checkbox.isChecked(),
-            'convert_timezone': self.convert_timezone_checkbox.isChecked(),
-            'organize_by_year': self.organize_by_year_checkbox.isChecked(),
-        }
+        if self._config_snapshot is None:
+            self._config_snapshot = dict(self._config_cache)
+        return self._config_snapshot
     
-    @Slot(object)
-    def _on_progress_updated(self, progress):
+    @Slot(int, int, int, str)
+    def _on_progress_updated(
+        self, downloaded: int, skipped: int, total: int, current_file: str
+    ):
         """Handle progress update from worker.
         
         Args:
-            progress: DownloadProgress object
+            downloaded: Number of files downloaded this run
+            skipped: Number of files already downloaded previously
+            total: Total number of files
+            current_file: Name of the most recently processed file
         """
+        self._pending_progress = (downloaded + skipped, total, current_file)
+        if not self._ui_timer.isActive():
+            self._ui_timer.start()
+    
+    @Slot()
+    def _flush_progress(self):
+        """Apply the most recent pending progress update to the progress widget."""
+        if self._pending_progress is None:
+            return
+        current, total, current_file = self._pending_progress
+        self._pending_progress = None
+        
         # Update progress widget
         self.progress_widget.update_progress(
-            current=progress.downloaded_files + progress.skipped_files,
-            total=progress.total_files,
-            operation=f"Processing: {progress.current_file}"
+            current=current,
+            total=total,
+            operation=f"Processing: {current_file}"
         )
     
     @Slot(str)
@@ -417,8 +637,9 @@ class DownloadTab(QWidget):
         Args:
             message: Status message text
         """
-        logger.info(f"Download status: {message}")
+        logger.info("Download status: %s", message)
         self.progress_widget.set_status(message)
+        self.progress_widget.append_log(message)
     
     @Slot(str, bool, str)
     def _on_file_downloaded(self, filename: str, success: bool, message: str):
@@ -430,9 +651,9 @@ class DownloadTab(QWidget):
             message: Status message
         """
         if success and message == "Downloaded":
-            logger.debug(f"Downloaded: {filename}")
+            logger.debug("Downloaded: %s", filename)
         elif not success:
-            logger.warning(f"Failed to download {filename}: {message}")
+            logger.warning("Failed to download %s: %s", filename, message)
     
     @Slot(bool, int, int)
     def _on_download_finished(self, success: bool, downloaded: int, failed: int):
@@ -443,29 +664,26 @@ class DownloadTab(QWidget):
             downloaded: Number of files downloaded
             failed: Number of failed downloads
         """
+        self._ui_timer.stop()
+        self._flush_progress()
         self._is_downloading = False
         self._set_ui_enabled(True)
         
         if success:
+            # Summarize in a non-modal banner so an unattended download
+            # doesn't leave a dialog blocking the GUI
             self.progress_widget.complete(
-                f"Download complete! {downloaded} new files, {failed} failed"
-            )
-            QMessageBox.information(
-                self,
-                "Download Complete",
-                f"Successfully downloaded {downloaded} memories.\n"
-                f"Failed: {failed}\n\n"
-                f"Files saved to: {self.output_path_edit.text()}"
+                f"Download complete! {downloaded} new files, {failed} failed",
+                detail=(
+                    f"Successfully downloaded {downloaded} memories.\n"
+                    f"Failed: {failed}\n\n"
+                    f"Files saved to: {self._config_cache['output_path']}"
+                ),
             )
             self.download_completed.emit()
         else:
             self.progress_widget.set_status("Download cancelled")
             self.download_cancelled.emit()
-        
-        # Clean up worker
-        if self._download_worker:
-            self._download_worker.deleteLater()
-            self._download_worker = None
     
     @Slot(str)
     def _on_download_error(self, error_message: str):
@@ -474,21 +692,18 @@ class DownloadTab(QWidget):
         Args:
             error_message: Error message text
         """
+        self._ui_timer.stop()
+        self._pending_progress = None
         self._is_downloading = False
         self._set_ui_enabled(True)
         
-        logger.error(f"Download error: {error_message}")
+        logger.error("Download error: %s", error_message)
         
-        QMessageBox.critical(
-            self,
+        self._show_message(
+            QMessageBox.Critical,
             "Download Error",
             f"An error occurred during download:\n\n{error_message}"
         )
         
         self.progress_widget.set_status(f"Error: {error_message}")
-        
-        # Clean up worker
-        if self._download_worker:
-            self._download_worker.deleteLater()
-            self._download_worker = None
 
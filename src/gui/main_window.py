@@ -4,7 +4,9 @@ This module provides the main window for Snapchat Organizer Desktop,
 featuring a tabbed interface for Download, Organize, and Tools functionality.
 """
 
-from typing import Optional
+import logging
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -12,7 +14,7 @@ from PySide6.QtWidgets import (
     QTabWidget,
     QMessageBox,
 )
-from PySide6.QtCore import QSize
+from PySide6.QtCore import QSize, QTimer, Slot
 from PySide6.QtGui import QAction, QIcon
 from pathlib import Path
 
@@ -29,11 +31,47 @@ from ..utils.config import (
     set_show_help_on_startup,
 )
 from ..utils.logger import get_logger
-from .settings_dialog import SettingsDialog
-from .help_dialog import HelpDialog
 
 logger = get_logger(__name__)
 
+# Window icon; QIcon reports a missing file as a null icon
+_ICON_PATH = Path(__file__).parent.parent.parent / "resources" / "icons" / "icon.png"
+
+# Help menu texts, built once at import
+_DOC_TEXT = (
+    f"{APP_NAME} Documentation\n\n"
+    "Complete documentation is available at:\n"
+    "https://github.com/M0hammedHaris/snapchat-organizer-desktop\n\n"
+    "For help downloading Snapchat data, use:\n"
+    "Help → How to Download Snapchat Data (F1)"
+)
+_ABOUT_TITLE = f"About {APP_NAME}"
+_ABOUT_HTML = (
+    f"<h2>{APP_NAME}</h2>"
+    f"<p>Version {APP_VERSION}</p>"
+    "<p>Desktop application for downloading and organizing "
+    "Snapchat memories locally.</p>"
+    "<p><b>Features:</b></p>"
+    "<ul>"
+    "<li>Download memories from HTML exports</li>"
+    "<li>Organize chat media by contact</li>"
+    "<li>Apply overlays to recreate Snapchat look</li>"
+    "<li>Preserve GPS metadata</li>"
+    "<li>100% private - all local processing</li>"
+    "</ul>"
+    "<p>© 2026 Mohammed Haris</p>"
+)
+
+
+@lru_cache(maxsize=1)
+def _app_icon() -> QIcon:
+    """Get the application window icon, loading it once per process.
+
+    Returns:
+        Window icon, null if the icon file is missing
+    """
+    return QIcon(str(_ICON_PATH))
+
 
 class MainWindow(QMainWindow):
     """Main application window with tabbed interface."""
@@ -46,18 +84,16 @@ class MainWindow(QMainWindow):
         """
         super().__init__(parent)
 
-        logger.info(f"Initializing {APP_NAME} v{APP_VERSION}")
+        logger.info("Initializing %s v%s", APP_NAME, APP_VERSION)
+
+        # The first-run check is scheduled from the first showEvent
+        self._first_show_done = False
 
         self._setup_ui()
         self._create_menu_bar()
 
         logger.debug("Main window initialized")
 
-        # Show help dialog on first run (using QTimer to ensure window is shown first)
-        from PySide6.QtCore import QTimer
-
-        QTimer.singleShot(500, self._check_first_run)
-
     def _setup_ui(self):
         """Set up the user interface."""
         # Window properties
@@ -66,10 +102,9 @@ class MainWindow(QMainWindow):
         self.resize(QSize(WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT))
 
         # Set window icon
-        resources_dir = Path(__file__).parent.parent.parent / "resources"
-        icon_path = resources_dir / "icons" / "icon.png"
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        icon = _app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
         # Central widget with layout
         central_widget = QWidget()
@@ -79,13 +114,63 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(10, 10, 10, 10)
 
         # Tab widget
+        # Document mode and the north tab position are the defaults. The three
+        # tabs always fit in the minimum window width, so scroll buttons are
+        # never needed.
         self.tab_widget = QTabWidget()
-        self.tab_widget.setDocumentMode(False)
-        self.tab_widget.setTabPosition(QTabWidget.North)
+        self.tab_widget.setUsesScrollButtons(False)
         layout.addWidget(self.tab_widget)
 
+        # Tabs added with add_lazy_tab, keyed by their placeholder page
+        self._tab_factories: Dict[QWidget, Callable[[], QWidget]] = {}
+        # Tab pages that have been built, in build order
+        self._tab_pages: List[QWidget] = []
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+
         logger.debug("UI setup complete")
 
+    def add_lazy_tab(
+        self, factory: Callable[[], QWidget], icon: QIcon, title: str
+    ) -> int:
+        """Add a tab whose page is built the first time it is selected.
+
+        Only a lightweight placeholder page is created now. The first tab
+        added becomes current straight away, so it is built immediately.
+
+        Args:
+            factory: Callable returning the real tab page
+            icon: Tab icon
+            title: Tab title
+
+        Returns:
+            Index of the new tab
+        """
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        self._tab_factories[placeholder] = factory
+        index = self.tab_widget.addTab(placeholder, icon, title)
+        # addTab only emits currentChanged for the very first tab
+        if index == self.tab_widget.currentIndex():
+            self._materialize_tab(index)
+        return index
+
+    @Slot(int)
+    def _materialize_tab(self, index: int):
+        """Build a lazily added tab's page the first time it is shown.
+
+        Args:
+            index: Index of the newly current tab
+        """
+        placeholder = self.tab_widget.widget(index)
+        factory = self._tab_factories.pop(placeholder, None)
+        if factory is None:
+            return
+        page = factory()
+        placeholder.layout().addWidget(page)
+        self._tab_pages.append(page)
+        logger.debug("Built tab: %s", self.tab_widget.tabText(index))
+
     def _create_menu_bar(self):
         """Create the application menu bar."""
         menubar = self.menuBar()
@@ -133,6 +218,8 @@ class MainWindow(QMainWindow):
     def _show_settings(self):
         """Show settings dialog."""
         logger.info("Opening settings dialog")
+        from .settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(self)
         dialog.settings_changed.connect(self._on_settings_changed)
         dialog.exec()
@@ -140,14 +227,18 @@ class MainWindow(QMainWindow):
     def _show_download_help(self):
         """Show help dialog for downloading Snapchat data."""
         logger.info("Opening download help dialog")
-        dialog = HelpDialog(self, show_dont_show_again=False)
+        from .help_dialog import HelpDialog
+
+        dialog = HelpDialog.open_for(self, show_dont_show_again=False)
         dialog.exec()
 
     def _check_first_run(self):
         """Check if this is the first run and show help dialog if needed."""
         if should_show_help_on_startup():
             logger.info("First run detected, showing help dialog")
-            dialog = HelpDialog(self, show_dont_show_again=True)
+            from .help_dialog import HelpDialog
+
+            dialog = HelpDialog.open_for(self, show_dont_show_again=True)
             dialog.exec()
 
             # If user checked "don't show again", save the preference
@@ -169,42 +260,32 @@ class MainWindow(QMainWindow):
         logger.info("Settings changed, applying new configuration")
         # TODO: Apply settings to application components
         # For now, just log the changes
-        for key, value in settings.items():
-            logger.debug(f"Setting changed: {key} = {value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for key, value in settings.items():
+                logger.debug("Setting changed: %s = %r", key, value)
 
     def _show_documentation(self):
         """Show documentation."""
         logger.info("Documentation requested")
-        QMessageBox.information(
-            self,
-            "Documentation",
-            f"{APP_NAME} Documentation\n\n"
-            "Complete documentation is available at:\n"
-            "https://github.com/M0hammedHaris/snapchat-organizer-desktop\n\n"
-            "For help downloading Snapchat data, use:\n"
-            "Help → How to Download Snapchat Data (F1)",
-        )
+        QMessageBox.information(self, "Documentation", _DOC_TEXT)
 
     def _show_about(self):
         """Show about dialog."""
         logger.info("About dialog requested")
-        QMessageBox.about(
-            self,
-            f"About {APP_NAME}",
-            f"<h2>{APP_NAME}</h2>"
-            f"<p>Version {APP_VERSION}</p>"
-            f"<p>Desktop application for downloading and organizing "
-            f"Snapchat memories locally.</p>"
-            f"<p><b>Features:</b></p>"
-            f"<ul>"
-            f"<li>Download memories from HTML exports</li>"
-            f"<li>Organize chat media by contact</li>"
-            f"<li>Apply overlays to recreate Snapchat look</li>"
-            f"<li>Preserve GPS metadata</li>"
-            f"<li>100% private - all local processing</li>"
-            f"</ul>"
-            f"<p>© 2026 Mohammed Haris</p>",
-        )
+        QMessageBox.about(self, _ABOUT_TITLE, _ABOUT_HTML)
+
+    def showEvent(self, event):
+        """Handle window show event.
+
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        if not self._first_show_done:
+            self._first_show_done = True
+            # Show help dialog on first run once the window has painted. The
+            # dialog modules are imported only when a dialog opens.
+            QTimer.singleShot(0, self._check_first_run)
 
     def closeEvent(self, event):
         """Handle window close event.
@@ -214,6 +295,11 @@ class MainWindow(QMainWindow):
         """
         logger.info("Application closing")
 
-        # TODO: Check if any operations are in progress
-        # For now, just accept the close event
+        # Stop and join each tab's worker thread so no QThread is destroyed
+        # while it is still running
+        for page in self._tab_pages:
+            shutdown = getattr(page, "shutdown", None)
+            if shutdown is not None:
+                shutdown()
+
         event.accept()
@@ -9,7 +9,8 @@ This tab provides UI for:
 - Cancel functionality
 """
 
-from typing import Optional
+import os
+from typing import List, Optional
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -28,14 +29,43 @@ from PySide6.QtWidgets import (
     QScrollArea,
     QFrame,
 )
-from PySide6.QtCore import Signal, Slot, Qt
+from PySide6.QtCore import QThreadPool, QTimer, QUrl, Signal, Slot, Qt
+from PySide6.QtGui import QDesktopServices
 
 from .progress_widget import ProgressWidget
 from ..core.organize_worker import OrganizeWorker
+from ..utils.config import PROGRESS_UPDATE_INTERVAL
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Start folder for the folder pickers until the user has picked one
+_HOME_DIR = str(Path.home())
+
+# Start confirmation message, filled in with the selected folders
+_CONFIRM_TEMPLATE = (
+    "Ready to organize media from:\n\n"
+    "Export: {name}\n"
+    "Media folders: {n}\n"
+    "Output: {out}\n\n"
+    "Continue?"
+)
+
+# Statistics panel text, filled in from the worker's statistics
+_STATS_TEMPLATE = (
+    "Total files: {total}\n"
+    "Organized: {organized} ({match_rate:.1f}%)\n"
+    "Unmatched: {unmatched}\n\n"
+    "Match Type Breakdown:\n"
+    "  • Exact Media ID: {exact_id}\n"
+    "  • Fuzzy Media ID: {fuzzy_id}\n"
+    "  • Time-based: {time_based}\n\n"
+    "Quality Metrics:\n"
+    "  • Low confidence: {low_conf} (score < 0.8)\n\n"
+    "⚠️  IMPORTANT: Review matching_report.txt for details.\n"
+    "Low confidence matches may require manual verification."
+)
+
 
 class OrganizeTab(QWidget):
     """Organize chat media tab widget.
@@ -49,6 +79,7 @@ class OrganizeTab(QWidget):
     organize_started = Signal()
     organize_completed = Signal()
     organize_cancelled = Signal()
+    _export_scan_done = Signal(str, bool, list)  # export folder, valid, media folder paths
     
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize the organize tab.
@@ -59,9 +90,32 @@ class OrganizeTab(QWidget):
         super().__init__(parent)
         
         self._is_organizing = False
-        self._organize_worker = None
+        # Reused for every run; configure() sets up each run before start()
+        self._organize_worker = OrganizeWorker()
+        self._organize_worker.progress_updated.connect(self._on_progress_updated)
+        self._organize_worker.stats_updated.connect(self._on_stats_updated)
+        self._organize_worker.finished.connect(self._on_organization_finished)
+        self._organize_worker.error.connect(self._on_organization_error)
+        # Whether the output folder is known to exist, kept up to date by
+        # the actions that change it instead of stat-ing on every UI update
+        self._output_exists = False
+        # chat_media* folders of the selected export, found off the GUI thread
+        self._media_dirs: List[str] = []
+        self._pending_export: Optional[str] = None
+        self._export_scan_done.connect(self._on_export_scan_done)
+        # Folder picker shared by both browse buttons, created on first use
+        self._dir_dialog: Optional[QFileDialog] = None
+        self._last_browse_dir = _HOME_DIR
         
         self._setup_ui()
+        # Controls that are only usable while no organization is running;
+        # disabling the settings group disables all of its controls at once
+        self._idle_only_widgets = (
+            self.browse_export_btn,
+            self.browse_output_btn,
+            self.start_btn,
+            self.config_group,
+        )
         logger.debug("Organize tab initialized")
     
     def _setup_ui(self):
@@ -83,6 +137,10 @@ class OrganizeTab(QWidget):
         content_layout.setSpacing(20)
         content_layout.setContentsMargins(30, 25, 30, 25)
         
+        # Attach the container before filling it
+        scroll_area.setWidget(content_widget)
+        main_layout.addWidget(scroll_area)
+        
         # Instructions header
         instructions = self._create_instructions_widget()
         content_layout.addWidget(instructions)
@@ -92,8 +150,8 @@ class OrganizeTab(QWidget):
         content_layout.addWidget(folder_group)
         
         # Matching configuration group
-        config_group = self._create_configuration_group()
-        content_layout.addWidget(config_group)
+        self.config_group = self._create_configuration_group()
+        content_layout.addWidget(self.config_group)
         
         # Action buttons
         button_layout = self._create_action_buttons()
@@ -105,16 +163,22 @@ class OrganizeTab(QWidget):
         self.progress_widget.cancel_requested.connect(self._on_cancel_requested)
         content_layout.addWidget(self.progress_widget)
         
+        # Progress and statistics arrive once per file; the timer coalesces
+        # them so the widgets repaint at most once per interval
+        self._pending_progress = None
+        self._pending_stats = None
+        self._last_stats_text = ""
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setSingleShot(True)
+        self._ui_timer.setInterval(PROGRESS_UPDATE_INTERVAL)
+        self._ui_timer.timeout.connect(self._flush_progress)
+        
         # Matching statistics display
         stats_group = self._create_statistics_group()
         content_layout.addWidget(stats_group)
         
         # Add stretch to push everything to top
         content_layout.addStretch()
-        
-        # Set scroll content
-        scroll_area.setWidget(content_widget)
-        main_layout.addWidget(scroll_area)
     
     def _create_instructions_widget(self) -> QGroupBox:
         """Create instructions widget with folder requirements.
@@ -123,15 +187,7 @@ class OrganizeTab(QWidget):
             QGroupBox with instructions
         """
         group = QGroupBox("ℹ️ Quick Start Guide")
-        group.setStyleSheet(
-            "QGroupBox { "
-            "font-weight: bold; "
-            "padding-top: 15px; "
-            "margin-top: 10px; "
-            "background-color: palette(alternate-base); "
-            "border-radius: 6px; "
-            "}"
-        )
+        group.setProperty("class", "InstructionsGroupBox")
         layout = QVBoxLayout(group)
         layout.setSpacing(8)
         layout.setContentsMargins(15, 20, 15, 15)
@@ -145,13 +201,7 @@ class OrganizeTab(QWidget):
         )
         instructions_text.setWordWrap(True)
         instructions_text.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        instructions_text.setStyleSheet(
-            "font-size: 11px; "
-            "padding: 12px; "
-            "background-color: palette(base); "
-            "border-radius: 4px; "
-            "font-weight: normal;"
-        )
+        instructions_text.setProperty("class", "InstructionsLabel")
         layout.addWidget(instructions_text)
         
         return group
@@ -163,7 +213,7 @@ class OrganizeTab(QWidget):
             QGroupBox with folder selection controls
         """
         group = QGroupBox("📂 Folder Selection")
-        group.setStyleSheet("QGroupBox { font-weight: bold; padding-top: 15px; margin-top: 10px; }")
+        group.setProperty("class", "StyledGroupBox")
         layout = QVBoxLayout(group)
         layout.setSpacing(12)
         layout.setContentsMargins(15, 20, 15, 15)
@@ -219,7 +269,7 @@ class OrganizeTab(QWidget):
             QGroupBox with configuration controls
         """
         group = QGroupBox("⚙️ Matching Settings")
-        group.setStyleSheet("QGroupBox { font-weight: bold; padding-top: 15px; margin-top: 10px; }")
+        group.setProperty("class", "StyledGroupBox")
         layout = QVBoxLayout(group)
         layout.setSpacing(12)
         layout.setContentsMargins(15, 20, 15, 15)
@@ -234,13 +284,7 @@ class OrganizeTab(QWidget):
         )
         info_label.setWordWrap(True)
         info_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        info_label.setStyleSheet(
-            "font-size: 11px; "
-            "padding: 12px; "
-            "background-color: palette(alternate-base); "
-            "border-radius: 4px; "
-            "border: 1px solid palette(mid);"
-        )
+        info_label.setProperty("class", "InfoLabel")
         layout.addWidget(info_label)
         layout.addSpacing(8)
         
@@ -330,7 +374,7 @@ class OrganizeTab(QWidget):
             QGroupBox with statistics display
         """
         group = QGroupBox("📊 Matching Statistics")
-        group.setStyleSheet("QGroupBox { font-weight: bold; padding-top: 15px; margin-top: 10px; }")
+        group.setProperty("class", "StyledGroupBox")
         layout = QVBoxLayout(group)
         layout.setSpacing(8)
         layout.setContentsMargins(15, 20, 15, 15)
@@ -340,15 +384,7 @@ class OrganizeTab(QWidget):
         self.stats_text.setMinimumHeight(120)
         self.stats_text.setMaximumHeight(180)
         self.stats_text.setPlaceholderText("Statistics will appear here after organization completes...")
-        self.stats_text.setStyleSheet(
-            "QTextEdit { "
-            "padding: 10px; "
-            "font-size: 12px; "
-            "line-height: 1.4; "
-            "border: 1px solid palette(mid); "
-            "border-radius: 4px; "
-            "}"
-        )
+        self.stats_text.setProperty("class", "StatsText")
         layout.addWidget(self.stats_text)
         
         return group
@@ -364,7 +400,7 @@ class OrganizeTab(QWidget):
         self.start_btn = QPushButton("🚀 Start Organization")
         self.start_btn.clicked.connect(self._on_start_clicked)
         self.start_btn.setMinimumHeight(45)
-        self.start_btn.setStyleSheet("QPushButton { font-size: 13px; padding: 8px; }")
+        self.start_btn.setProperty("class", "StartButton")
         layout.addWidget(self.start_btn)
         
         self.open_output_btn = QPushButton("📁 Open Output Folder")
@@ -374,57 +410,138 @@ class OrganizeTab(QWidget):
         
         return layout
     
+    def _pick_dir(self, title: str, initial: str) -> Optional[str]:
+        """Ask the user for a folder with the shared folder picker.
+        
+        Args:
+            title: Dialog window title
+            initial: Folder the dialog opens in
+            
+        Returns:
+            Selected folder, or None if the dialog was cancelled
+        """
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self)
+            self._dir_dialog.setFileMode(QFileDialog.Directory)
+            self._dir_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+            # Exports often hold many media folders; skip symlink resolution
+            # and per-folder icon lookups while listing them
+            self._dir_dialog.setOption(QFileDialog.DontResolveSymlinks, True)
+            self._dir_dialog.setOption(QFileDialog.DontUseCustomDirectoryIcons, True)
+        
+        dialog = self._dir_dialog
+        dialog.setWindowTitle(title)
+        dialog.setDirectory(initial)
+        if dialog.exec() != QFileDialog.Accepted:
+            return None
+        
+        selected = dialog.selectedFiles()
+        if not selected:
+            return None
+        self._last_browse_dir = selected[0]
+        return selected[0]
+    
     @Slot()
     def _browse_export_folder(self):
         """Browse for Snapchat export folder."""
-        folder = QFileDialog.getExistingDirectory(
-            self,
+        folder = self._pick_dir(
             "Select Snapchat Export Folder",
-            str(Path.home()),
-            QFileDialog.ShowDirsOnly
+            self.export_path_edit.text() or self._last_browse_dir
         )
         
         if folder:
-            # Validate folder contains required files
-            export_path = Path(folder)
-            chat_json = export_path / "chat_history" / "json" / "chat_history.json"
-            
-            if not chat_json.exists():
-                QMessageBox.warning(
-                    self,
-                    "Invalid Export Folder",
-                    "Selected folder doesn't contain chat_history/json/chat_history.json\n\n"
-                    "Please select the root folder of your Snapchat export."
-                )
-                return
-            
-            # Check for chat_media folders
-            media_dirs = list(export_path.glob("chat_media*"))
-            if not media_dirs:
-                QMessageBox.warning(
-                    self,
-                    "No Media Folders Found",
-                    "Selected folder doesn't contain any chat_media folders.\n\n"
-                    "Make sure you're selecting the correct Snapchat export folder."
-                )
-                return
-            
-            self.export_path_edit.setText(folder)
-            logger.info(f"Export folder selected: {folder} ({len(media_dirs)} media folders found)")
+            # Validate the folder and look for chat_media folders on a pool
+            # thread, since a large export on slow storage can take a while
+            # to list
+            self._pending_export = folder
+            self.browse_export_btn.setEnabled(False)
+            self.setCursor(Qt.BusyCursor)
+            self.progress_widget.set_status("Checking export folder...")
+            QThreadPool.globalInstance().start(
+                lambda: self._scan_export(folder)
+            )
+    
+    def _scan_export(self, folder: str):
+        """Check an export folder and find its chat_media folders.
+        
+        Lists the folder once for both chat_history and the chat_media
+        folders. Runs on a QThreadPool thread and reports the result
+        through ``_export_scan_done``.
+        
+        Args:
+            folder: Snapchat export folder
+        """
+        has_chat_history = False
+        media_dirs: List[str] = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("chat_media"):
+                        if entry.is_dir():
+                            media_dirs.append(entry.path)
+                    elif name == "chat_history" and entry.is_dir():
+                        has_chat_history = True
+        except OSError as e:
+            logger.warning("Could not read export folder %s: %s", folder, e)
+        
+        is_valid = has_chat_history and os.path.isfile(
+            os.path.join(folder, "chat_history", "json", "chat_history.json")
+        )
+        self._export_scan_done.emit(folder, is_valid, media_dirs)
+    
+    @Slot(str, bool, list)
+    def _on_export_scan_done(self, folder: str, is_valid: bool, media_dirs: list):
+        """Apply the result of an export folder scan.
+        
+        Args:
+            folder: Export folder that was scanned
+            is_valid: Whether the folder has chat_history/json/chat_history.json
+            media_dirs: Paths of the chat_media folders found
+        """
+        if folder != self._pending_export:
+            return  # A newer selection superseded this scan
+        self._pending_export = None
+        self.unsetCursor()
+        self.progress_widget.set_status("")
+        self.browse_export_btn.setEnabled(not self._is_organizing)
+        
+        if not is_valid:
+            QMessageBox.warning(
+                self,
+                "Invalid Export Folder",
+                "Selected folder doesn't contain chat_history/json/chat_history.json\n\n"
+                "Please select the root folder of your Snapchat export."
+            )
+            return
+        
+        if not media_dirs:
+            QMessageBox.warning(
+                self,
+                "No Media Folders Found",
+                "Selected folder doesn't contain any chat_media folders.\n\n"
+                "Make sure you're selecting the correct Snapchat export folder."
+            )
+            return
+        
+        self._media_dirs = media_dirs
+        self.export_path_edit.setText(folder)
+        logger.info(
+            "Export folder selected: %s (%d media folders found)", folder, len(media_dirs)
+        )
     
     @Slot()
     def _browse_output_folder(self):
         """Browse for output folder."""
-        folder = QFileDialog.getExistingDirectory(
-            self,
+        folder = self._pick_dir(
             "Select Output Folder",
-            str(Path.home()),
-            QFileDialog.ShowDirsOnly
+            self.output_path_edit.text() or self._last_browse_dir
         )
         
         if folder:
             self.output_path_edit.setText(folder)
-            logger.info(f"Output folder selected: {folder}")
+            self._output_exists = True
+            logger.info("Output folder selected: %s", folder)
     
     @Slot()
     def _on_start_clicked(self):
@@ -449,16 +566,13 @@ class OrganizeTab(QWidget):
         # Confirm start
         export_path = Path(self.export_path_edit.text())
         output_path = Path(self.output_path_edit.text())
-        media_dirs = list(export_path.glob("chat_media*"))
         
         reply = QMessageBox.question(
             self,
             "Start Organization",
-            f"Ready to organize media from:\n\n"
-            f"Export: {export_path.name}\n"
-            f"Media folders: {len(media_dirs)}\n"
-            f"Output: {output_path}\n\n"
-            f"Continue?",
+            _CONFIRM_TEMPLATE.format(
+                name=export_path.name, n=len(self._media_dirs), out=output_path
+            ),
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.Yes
         )
@@ -466,6 +580,8 @@ class OrganizeTab(QWidget):
         if reply == QMessageBox.No:
             return
         
+        # The organizer creates the output folder if it is missing
+        self._output_exists = True
         self._start_organization()
     
     def _start_organization(self):
@@ -484,8 +600,10 @@ class OrganizeTab(QWidget):
         create_report = self.create_debug_report_checkbox.isChecked()
         preserve_originals = self.preserve_originals_checkbox.isChecked()
         
-        # Create and configure worker
-        self._organize_worker = OrganizeWorker(
+        # Configure the worker; the previous run may still be unwinding
+        # after emitting finished
+        self._organize_worker.wait()
+        self._organize_worker.configure(
             export_path=export_path,
             output_path=output_path,
             timestamp_threshold=threshold,
@@ -498,18 +616,13 @@ class OrganizeTab(QWidget):
             preserve_originals=preserve_originals,
         )
         
-        # Connect signals
-        self._organize_worker.progress_updated.connect(self._on_progress_updated)
-        self._organize_worker.stats_updated.connect(self._on_stats_updated)
-        self._organize_worker.finished.connect(self._on_organization_finished)
-        self._organize_worker.error.connect(self._on_organization_error)
-        
         # Update UI state
         self._is_organizing = True
         self._update_ui_state()
         
         # Clear previous stats
         self.stats_text.clear()
+        self._last_stats_text = ""
         self.progress_widget.reset()
         self.progress_widget.set_status("Starting organization...")
         
@@ -536,8 +649,14 @@ class OrganizeTab(QWidget):
         
         if reply == QMessageBox.Yes:
             logger.info("User requested cancel")
-            if self._organize_worker:
-                self._organize_worker.cancel()
+            self._organize_worker.cancel()
+    
+    def shutdown(self):
+        """Cancel any running organization and wait for the worker to exit."""
+        if self._organize_worker.isRunning():
+            logger.info("Stopping organization worker for shutdown")
+            self._organize_worker.cancel()
+        self._organize_worker.wait()
     
     @Slot(int, int, str)
     def _on_progress_updated(self, current: int, total: int, status: str):
@@ -548,40 +667,90 @@ class OrganizeTab(QWidget):
             total: Total progress value
             status: Status message
         """
-        self.progress_widget.update_progress(current, total)
-        self.progress_widget.set_status(status)
+        self._pending_progress = (current, total, status)
+        if not self._ui_timer.isActive():
+            self._ui_timer.start()
     
-    @Slot(dict)
-    def _on_stats_updated(self, stats: dict):
+    @Slot(int, int, int, int, int, int, int)
+    def _on_stats_updated(
+        self,
+        total: int,
+        organized: int,
+        unmatched: int,
+        low_conf: int,
+        exact_id: int,
+        fuzzy_id: int,
+        time_based: int,
+    ):
         """Handle statistics updates from worker.
         
         Args:
-            stats: Statistics dictionary
+            total: Total number of media files
+            organized: Files matched and organized
+            unmatched: Files without a match
+            low_conf: Matches with a score below 0.8
+            exact_id: Matches by exact media ID
+            fuzzy_id: Matches by fuzzy media ID
+            time_based: Matches by timestamp only
         """
-        total = stats.get("total", 0)
-        organized = stats.get("organized", 0)
-        unmatched = stats.get("unmatched", 0)
-        low_conf = stats.get("low_confidence", 0)
-        exact_id = stats.get("exact_media_id", 0)
-        fuzzy_id = stats.get("fuzzy_media_id", 0)
-        time_based = stats.get("time_based", 0)
+        self._pending_stats = (
+            total, organized, unmatched, low_conf, exact_id, fuzzy_id, time_based
+        )
+        if not self._ui_timer.isActive():
+            self._ui_timer.start()
+    
+    @Slot()
+    def _flush_progress(self):
+        """Apply the most recent pending progress and statistics updates."""
+        if self._pending_progress is not None:
+            current, total, status = self._pending_progress
+            self._pending_progress = None
+            self.progress_widget.update_progress(current, total)
+            self.progress_widget.set_status(status)
+        
+        if self._pending_stats is not None:
+            stats = self._pending_stats
+            self._pending_stats = None
+            self._show_stats(*stats)
+    
+    def _show_stats(
+        self,
+        total: int,
+        organized: int,
+        unmatched: int,
+        low_conf: int,
+        exact_id: int,
+        fuzzy_id: int,
+        time_based: int,
+    ):
+        """Display matching statistics.
         
+        Args:
+            total: Total number of media files
+            organized: Files matched and organized
+            unmatched: Files without a match
+            low_conf: Matches with a score below 0.8
+            exact_id: Matches by exact media ID
+            fuzzy_id: Matches by fuzzy media ID
+            time_based: Matches by timestamp only
+        """
         match_rate = (organized / total * 100) if total > 0 else 0
         
-        stats_text = (
-            f"Total files: {total}\n"
-            f"Organized: {organized} ({match_rate:.1f}%)\n"
-            f"Unmatched: {unmatched}\n\n"
-            f"Match Type Breakdown:\n"
-            f"  • Exact Media ID: {exact_id}\n"
-            f"  • Fuzzy Media ID: {fuzzy_id}\n"
-            f"  • Time-based: {time_based}\n\n"
-            f"Quality Metrics:\n"
-            f"  • Low confidence: {low_conf} (score < 0.8)\n\n"
-            f"⚠️  IMPORTANT: Review matching_report.txt for details.\n"
-            f"Low confidence matches may require manual verification."
+        stats_text = _STATS_TEMPLATE.format(
+            total=total,
+            organized=organized,
+            match_rate=match_rate,
+            unmatched=unmatched,
+            exact_id=exact_id,
+            fuzzy_id=fuzzy_id,
+            time_based=time_based,
+            low_conf=low_conf,
         )
         
+        # Re-setting the same text would still re-lay out the whole document
+        if stats_text == self._last_stats_text:
+            return
+        self._last_stats_text = stats_text
         self.stats_text.setPlainText(stats_text)
     
     @Slot(bool, str)
@@ -592,6 +761,8 @@ class OrganizeTab(QWidget):
             success: Whether organization succeeded
             message: Completion message
         """
+        self._ui_timer.stop()
+        self._flush_progress()
         self._is_organizing = False
         self._update_ui_state()
         
@@ -620,13 +791,8 @@ class OrganizeTab(QWidget):
                 "Organization Cancelled",
                 message
             )
-            logger.warning(f"Organization cancelled: {message}")
+            logger.warning("Organization cancelled: %s", message)
             self.organize_cancelled.emit()
-        
-        # Clean up worker
-        if self._organize_worker:
-            self._organize_worker.deleteLater()
-            self._organize_worker = None
     
     @Slot(str)
     def _on_organization_error(self, error_message: str):
@@ -635,6 +801,8 @@ class OrganizeTab(QWidget):
         Args:
             error_message: Error message
         """
+        self._ui_timer.stop()
+        self._pending_progress = None
         self._is_organizing = False
         self._update_ui_state()
         
@@ -644,53 +812,29 @@ class OrganizeTab(QWidget):
             f"An error occurred during organization:\\n\\n{error_message}"
         )
         
-        logger.error(f"Organization error: {error_message}")
-        
-        # Clean up worker
-        if self._organize_worker:
-            self._organize_worker.deleteLater()
-            self._organize_worker = None
+        logger.error("Organization error: %s", error_message)
     
     @Slot()
     def _on_open_output_clicked(self):
         """Open the output folder in file explorer."""
         output_path = self.output_path_edit.text()
-        if output_path and Path(output_path).exists():
-            import subprocess
-            import platform
-            
-            system = platform.system()
-            if system == "Darwin":  # macOS
-                subprocess.run(["open", output_path])
-            elif system == "Windows":
-                subprocess.run(["explorer", output_path])
-            else:  # Linux
-                subprocess.run(["xdg-open", output_path])
-            
-            logger.info(f"Opened output folder: {output_path}")
+        # The user may have moved the folder since, so check it once here
+        self._output_exists = bool(output_path) and os.path.isdir(output_path)
+        self.open_output_btn.setEnabled(self._output_exists)
+        if self._output_exists:
+            # Hand off to the platform file manager without blocking the click
+            QDesktopServices.openUrl(QUrl.fromLocalFile(output_path))
+            logger.info("Opened output folder: %s", output_path)
     
     def _update_ui_state(self):
         """Update UI elements based on current state."""
         is_idle = not self._is_organizing
         
-        self.browse_export_btn.setEnabled(is_idle)
-        self.browse_output_btn.setEnabled(is_idle)
-        self.start_btn.setEnabled(is_idle)
-        self.enable_tier1_checkbox.setEnabled(is_idle)
-        self.enable_tier2_checkbox.setEnabled(is_idle)
-        self.enable_tier3_checkbox.setEnabled(is_idle)
-        self.threshold_spinbox.setEnabled(is_idle)
-        self.organize_by_year_checkbox.setEnabled(is_idle)
-        self.create_debug_report_checkbox.setEnabled(is_idle)
+        for widget in self._idle_only_widgets:
+            widget.setEnabled(is_idle)
         
         # Update button text
-        if self._is_organizing:
-            self.start_btn.setText("⏳ Organizing...")
-        else:
-            self.start_btn.setText("🚀 Start Organization")
+        self.start_btn.setText("🚀 Start Organization" if is_idle else "⏳ Organizing...")
         
         # Enable open output button if output folder exists
-        output_path = self.output_path_edit.text()
-        self.open_output_btn.setEnabled(
-            bool(output_path) and Path(output_path).exists()
-        )
+        self.open_output_btn.setEnabled(self._output_exists)
@@ -6,9 +6,12 @@ This widget provides a consistent progress display with:
 - File counters (X / Y files)
 - ETA (estimated time remaining)
 - Cancel button functionality
+- Dismissable completion banner
+- Bounded activity log
 """
 
-from typing import Optional
+import time
+from typing import List, Optional
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,9 +19,16 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QLabel,
     QPushButton,
+    QFrame,
+    QPlainTextEdit,
+)
+from PySide6.QtCore import Signal, Slot, Qt, QTimer
+
+from ..utils.config import (
+    COMPLETION_BANNER_TIMEOUT,
+    PROGRESS_LOG_MAX_LINES,
+    PROGRESS_LOG_FLUSH_INTERVAL,
 )
-from PySide6.QtCore import Signal, Slot, Qt
-from datetime import datetime, timedelta
 
 
 class ProgressWidget(QWidget):
@@ -39,9 +49,11 @@ class ProgressWidget(QWidget):
         super().__init__(parent)
         
         # State tracking
-        self._start_time: Optional[datetime] = None
+        # Monotonic clock reading when the operation started
+        self._start_time: Optional[float] = None
         self._current_count = 0
         self._total_count = 0
+        self._pending_log_lines: List[str] = []
         
         self._setup_ui()
         
@@ -78,6 +90,48 @@ class ProgressWidget(QWidget):
         self.operation_label.setStyleSheet("color: #666;")
         layout.addWidget(self.operation_label)
         
+        # Completion banner (hidden by default)
+        self.banner = QFrame()
+        self.banner.setFrameShape(QFrame.StyledPanel)
+        banner_layout = QHBoxLayout(self.banner)
+        banner_layout.setContentsMargins(10, 6, 6, 6)
+        
+        self.banner_label = QLabel("")
+        self.banner_label.setWordWrap(True)
+        self.banner_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        banner_layout.addWidget(self.banner_label, stretch=1)
+        
+        self.banner_close_button = QPushButton("✕")
+        self.banner_close_button.setFlat(True)
+        self.banner_close_button.setToolTip("Dismiss")
+        self.banner_close_button.clicked.connect(self.hide_banner)
+        banner_layout.addWidget(self.banner_close_button, alignment=Qt.AlignTop)
+        
+        self.banner.setVisible(False)
+        layout.addWidget(self.banner)
+        
+        # Hides the banner after a while; restarted by every show_banner and
+        # stopped by hide_banner, so an earlier banner can't hide a newer one
+        self._banner_timer = QTimer(self)
+        self._banner_timer.setSingleShot(True)
+        self._banner_timer.setInterval(COMPLETION_BANNER_TIMEOUT)
+        self._banner_timer.timeout.connect(self.hide_banner)
+        
+        # Activity log (hidden until the first line arrives). The block
+        # limit makes Qt drop the oldest lines instead of growing forever.
+        self.log_view = QPlainTextEdit()
+        self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(PROGRESS_LOG_MAX_LINES)
+        self.log_view.setMaximumHeight(120)
+        self.log_view.setVisible(False)
+        layout.addWidget(self.log_view)
+        
+        # Log lines are buffered and appended in one batch per interval
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(PROGRESS_LOG_FLUSH_INTERVAL)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         # Cancel button (hidden by default)
         self.cancel_button = QPushButton("Cancel")
         self.cancel_button.clicked.connect(self._on_cancel_clicked)
@@ -98,10 +152,12 @@ class ProgressWidget(QWidget):
             total: Total number of items to process
             status_text: Initial status text
         """
-        self._start_time = datetime.now()
+        self._start_time = time.monotonic()
         self._current_count = 0
         self._total_count = total
         
+        self.hide_banner()
+        self.clear_log()
         self.progress_bar.setValue(0)
         self.status_label.setText(f"0 / {total} files")
         self.operation_label.setText(status_text)
@@ -150,7 +206,7 @@ class ProgressWidget(QWidget):
             self.eta_label.setText("")
             return
         
-        elapsed = (datetime.now() - self._start_time).total_seconds()
+        elapsed = time.monotonic() - self._start_time
         
         if self._current_count >= self._total_count:
             # Completed
@@ -173,16 +229,13 @@ class ProgressWidget(QWidget):
         Returns:
             Formatted string (e.g., "2m 30s", "1h 5m", "45s")
         """
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            secs = int(seconds % 60)
-            return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds / 3600)
-            minutes = int((seconds % 3600) / 60)
+        hours, rem = divmod(int(seconds), 3600)
+        minutes, secs = divmod(rem, 60)
+        if hours:
             return f"{hours}h {minutes}m"
+        if minutes:
+            return f"{minutes}m {secs}s"
+        return f"{secs}s"
     
     def set_status(self, text: str):
         """Set status text without changing progress.
@@ -210,16 +263,73 @@ class ProgressWidget(QWidget):
         self.operation_label.setText(f"✅ {success_text}")
         self.operation_label.setStyleSheet("color: #388e3c;")
     
-    def complete(self, message: str = "Operation completed successfully"):
+    def complete(
+        self,
+        message: str = "Operation completed successfully",
+        detail: Optional[str] = None,
+    ):
         """Mark operation as complete.
         
         Args:
             message: Completion message
+            detail: Longer summary shown in a dismissable banner (optional)
         """
         self.progress_bar.setValue(100)
         self.set_success(message)
         self.cancel_button.setVisible(False)
         self._update_eta()
+        
+        if detail:
+            self.show_banner(detail)
+    
+    def show_banner(self, text: str):
+        """Show the inline banner without blocking the event loop.
+        
+        The banner hides itself after COMPLETION_BANNER_TIMEOUT.
+        
+        Args:
+            text: Banner text
+        """
+        self.banner_label.setText(text)
+        self.banner.setVisible(True)
+        self._banner_timer.start()
+    
+    @Slot()
+    def hide_banner(self):
+        """Hide the inline banner."""
+        self._banner_timer.stop()
+        self.banner.setVisible(False)
+    
+    @Slot(str)
+    def append_log(self, line: str):
+        """Queue a line for the activity log.
+        
+        Args:
+            line: Log line to append
+        """
+        self._pending_log_lines.append(line)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    @Slot()
+    def _flush_log(self):
+        """Append all buffered log lines in a single call."""
+        if not self._pending_log_lines:
+            return
+        
+        # Only the last PROGRESS_LOG_MAX_LINES lines can be kept anyway
+        lines = self._pending_log_lines[-PROGRESS_LOG_MAX_LINES:]
+        self._pending_log_lines = []
+        
+        self.log_view.appendPlainText("\n".join(lines))
+        self.log_view.setVisible(True)
+    
+    def clear_log(self):
+        """Clear and hide the activity log."""
+        self._log_timer.stop()
+        self._pending_log_lines = []
+        self.log_view.clear()
+        self.log_view.setVisible(False)
     
     def reset(self):
         """Reset the widget to initial state."""
@@ -232,6 +342,8 @@ class ProgressWidget(QWidget):
         self.operation_label.setText("")
         self.operation_label.setStyleSheet("color: #666;")
         self.eta_label.setText("")
+        self.hide_banner()
+        self.clear_log()
         self.cancel_button.setVisible(False)
         self.cancel_button.setEnabled(True)
         self.cancel_button.setText("Cancel")
@@ -5,8 +5,9 @@ preferences, default paths, behavior options, and view application information.
 """
 
 import logging
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Tuple
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
@@ -21,7 +22,6 @@ from PySide6.QtWidgets import (
     QCheckBox,
     QSpinBox,
     QDoubleSpinBox,
-    QFileDialog,
     QWidget,
     QFormLayout,
     QMessageBox,
@@ -38,12 +38,26 @@ from src.utils.config import (
     DEFAULT_TIMESTAMP_THRESHOLD,
     MIN_TIMESTAMP_THRESHOLD,
     MAX_TIMESTAMP_THRESHOLD,
+    CONFIG_FILE,
     load_settings,
     save_settings,
 )
 
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QFileDialog
+
 logger = logging.getLogger(__name__)
 
+# About tab text; the app details are fixed for the life of the process
+_ABOUT_TITLE_HTML = f"<h1>{APP_NAME}</h1>"
+_ABOUT_VERSION = f"Version {APP_VERSION}"
+_ABOUT_DESCRIPTION = (
+    "Professional desktop application for downloading and organizing "
+    "Snapchat memories locally with overlay compositing, GPS metadata "
+    "preservation, and timezone conversion."
+)
+_ABOUT_COPYRIGHT = f"© 2026 {APP_AUTHOR}. All Rights Reserved."
+
 
 class SettingsDialog(QDialog):
     """Dialog for application settings and preferences.
@@ -60,6 +74,27 @@ class SettingsDialog(QDialog):
 
     settings_changed = Signal(dict)  # Emits dictionary of changed settings
 
+    # Settings keys with the config section and key that store each one,
+    # the widget attribute that edits it and the widget's getter and setter
+    _FIELDS: ClassVar[Tuple[Tuple[str, str, str, str, str, str], ...]] = (
+        ('default_download_dir', 'general', 'default_download_path', 'default_download_edit', 'text', 'setText'),
+        ('default_export_dir', 'general', 'default_export_path', 'default_export_edit', 'text', 'setText'),
+        ('remember_last_paths', 'general', 'remember_last_paths', 'remember_last_paths_check', 'isChecked', 'setChecked'),
+        ('auto_open_output', 'general', 'auto_open_output', 'auto_open_output_check', 'isChecked', 'setChecked'),
+        ('confirm_operations', 'general', 'confirm_operations', 'confirm_operations_check', 'isChecked', 'setChecked'),
+        ('download_delay', 'download', 'delay_seconds', 'download_delay_spin', 'value', 'setValue'),
+        ('max_retries', 'download', 'max_retries', 'max_retries_spin', 'value', 'setValue'),
+        ('timeout', 'download', 'timeout_seconds', 'timeout_spin', 'value', 'setValue'),
+        ('default_gps', 'download', 'default_apply_gps', 'default_gps_check', 'isChecked', 'setChecked'),
+        ('default_overlay', 'download', 'default_apply_overlay', 'default_overlay_check', 'isChecked', 'setChecked'),
+        ('default_timezone', 'download', 'default_convert_timezone', 'default_timezone_check', 'isChecked', 'setChecked'),
+        ('time_window', 'organize', 'time_window_seconds', 'time_window_spin', 'value', 'setValue'),
+        ('min_score', 'organize', 'minimum_score', 'min_score_spin', 'value', 'setValue'),
+        ('copy_files', 'organize', 'copy_files', 'copy_files_check', 'isChecked', 'setChecked'),
+        ('preserve_structure', 'organize', 'preserve_structure', 'preserve_structure_check', 'isChecked', 'setChecked'),
+        ('create_report', 'organize', 'create_report', 'create_report_check', 'isChecked', 'setChecked'),
+    )
+
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize the settings dialog.
         
@@ -73,6 +108,13 @@ class SettingsDialog(QDialog):
         # Store original settings to detect changes
         self._original_settings: Dict[str, Any] = {}
         self._current_settings: Dict[str, Any] = {}
+        # Full config read by _load_settings, reused when saving
+        self._config: Dict[str, Any] = {}
+        self._config_mtime: Optional[int] = None
+        # Values for fields on tabs that have not been built yet
+        self._deferred_values: Dict[str, Any] = {}
+        # Folder picker shared by the Browse buttons, created on first use
+        self._dir_dialog: Optional["QFileDialog"] = None
         
         self._setup_ui()
         self._load_settings()
@@ -82,12 +124,23 @@ class SettingsDialog(QDialog):
         """Set up the user interface."""
         layout = QVBoxLayout(self)
 
-        # Create tab widget
+        # Create tab widget. Only the General tab is built up front; the
+        # others start as empty placeholders and are built the first time
+        # they are shown.
+        self._tab_builders = {
+            1: self._create_download_tab,
+            2: self._create_organize_tab,
+            3: self._create_about_tab,
+        }
         tab_widget = QTabWidget()
         tab_widget.addTab(self._create_general_tab(), "General")
-        tab_widget.addTab(self._create_download_tab(), "Download")
-        tab_widget.addTab(self._create_organize_tab(), "Organize")
-        tab_widget.addTab(self._create_about_tab(), "About")
+        for title in ("Download", "Organize", "About"):
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            tab_widget.addTab(placeholder, title)
+        self.tab_widget = tab_widget
+        tab_widget.currentChanged.connect(self._on_tab_changed)
 
         layout.addWidget(tab_widget)
 
@@ -114,6 +167,21 @@ class SettingsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _on_tab_changed(self, index: int):
+        """Build a tab's contents the first time it is shown.
+        
+        Args:
+            index: Index of the newly current tab
+        """
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self.tab_widget.widget(index).layout().addWidget(builder())
+        
+        # Show the values loaded or restored while the tab did not exist
+        deferred, self._deferred_values = self._deferred_values, {}
+        self._apply_values(deferred)
+
     def _create_general_tab(self) -> QWidget:
         """Create the general settings tab.
         
@@ -130,25 +198,11 @@ class SettingsDialog(QDialog):
         paths_layout = QFormLayout(paths_group)
 
         # Default download directory
-        self.default_download_edit = QLineEdit()
-        download_browse = QPushButton("Browse...")
-        download_browse.clicked.connect(
-            lambda _: self._browse_directory(self.default_download_edit)
-        )
-        download_layout = QHBoxLayout()
-        download_layout.addWidget(self.default_download_edit)
-        download_layout.addWidget(download_browse)
+        self.default_download_edit, download_layout = self._create_path_picker()
         paths_layout.addRow("Default Download Folder:", download_layout)
 
         # Default export directory
-        self.default_export_edit = QLineEdit()
-        export_browse = QPushButton("Browse...")
-        export_browse.clicked.connect(
-            lambda _: self._browse_directory(self.default_export_edit)
-        )
-        export_layout = QHBoxLayout()
-        export_layout.addWidget(self.default_export_edit)
-        export_layout.addWidget(export_browse)
+        self.default_export_edit, export_layout = self._create_path_picker()
         paths_layout.addRow("Default Export Folder:", export_layout)
 
         layout.addWidget(paths_group)
@@ -175,6 +229,20 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return widget
 
+    def _create_path_picker(self) -> Tuple[QLineEdit, QHBoxLayout]:
+        """Create a folder path field with a Browse button.
+        
+        Returns:
+            The path field and the layout holding it and its button
+        """
+        edit = QLineEdit()
+        browse_btn = QPushButton("Browse...")
+        browse_btn.clicked.connect(partial(self._browse_directory, edit))
+        picker_layout = QHBoxLayout()
+        picker_layout.addWidget(edit)
+        picker_layout.addWidget(browse_btn)
+        return edit, picker_layout
+
     def _create_download_tab(self) -> QWidget:
         """Create the download settings tab.
         
@@ -259,7 +327,7 @@ class SettingsDialog(QDialog):
         
         time_help = QLabel("Maximum time difference for timestamp matching (default: 2 hours)")
         time_help.setWordWrap(True)
-        time_help.setStyleSheet("color: #666; font-size: 11px;")
+        time_help.setProperty("class", "SettingsHelpLabel")
         matching_layout.addRow("", time_help)
 
         # Minimum score
@@ -271,7 +339,7 @@ class SettingsDialog(QDialog):
         
         score_help = QLabel("Minimum confidence score for matching (default: 45%)")
         score_help.setWordWrap(True)
-        score_help.setStyleSheet("color: #666; font-size: 11px;")
+        score_help.setProperty("class", "SettingsHelpLabel")
         matching_layout.addRow("", score_help)
 
         layout.addWidget(matching_group)
@@ -311,24 +379,20 @@ class SettingsDialog(QDialog):
         layout.setSpacing(15)
 
         # App icon/logo placeholder
-        title = QLabel(f"<h1>{APP_NAME}</h1>")
+        title = QLabel(_ABOUT_TITLE_HTML)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         # Version
-        version = QLabel(f"Version {APP_VERSION}")
+        version = QLabel(_ABOUT_VERSION)
         version.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version.setStyleSheet("color: #666; font-size: 14px;")
+        version.setProperty("class", "AboutVersionLabel")
         layout.addWidget(version)
 
         layout.addSpacing(20)
 
         # Description
-        description = QLabel(
-            "Professional desktop application for downloading and organizing "
-            "Snapchat memories locally with overlay compositing, GPS metadata "
-            "preservation, and timezone conversion."
-        )
+        description = QLabel(_ABOUT_DESCRIPTION)
         description.setWordWrap(True)
         description.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(description)
@@ -346,9 +410,9 @@ class SettingsDialog(QDialog):
         layout.addWidget(info_group)
 
         # Copyright
-        copyright_label = QLabel(f"© 2026 {APP_AUTHOR}. All Rights Reserved.")
+        copyright_label = QLabel(_ABOUT_COPYRIGHT)
         copyright_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        copyright_label.setStyleSheet("color: #999; font-size: 11px; margin-top: 20px;")
+        copyright_label.setProperty("class", "AboutCopyrightLabel")
         layout.addWidget(copyright_label)
 
         layout.addStretch()
@@ -360,108 +424,123 @@ class SettingsDialog(QDialog):
         Args:
             line_edit: Line edit to update with selected path
         """
-        current_path = line_edit.text() or str(Path.home())
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Directory",
-            current_path,
-            QFileDialog.Option.ShowDirsOnly
-        )
+        # Imported here so opening the dialog doesn't pay for initializing
+        # the QFileDialog type until a Browse button is actually used
+        from PySide6.QtWidgets import QFileDialog
+        
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self, "Select Directory")
+            self._dir_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._dir_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        
+        dialog = self._dir_dialog
+        dialog.setDirectory(line_edit.text() or str(Path.home()))
+        if dialog.exec() != QFileDialog.DialogCode.Accepted:
+            return
         
-        if directory:
+        selected = dialog.selectedFiles()
+        if selected:
+            directory = selected[0]
             line_edit.setText(directory)
             logger.debug(f"Directory selected: {directory}")
 
+    @staticmethod
+    def _get_config_mtime() -> Optional[int]:
+        """Get the modification time of the config file.
+        
+        Returns:
+            Modification time in nanoseconds, or None if the file is missing
+        """
+        try:
+            return CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _load_settings(self):
         """Load current settings from configuration."""
         # Load from config file
         config = load_settings()
+        self._config = config
+        self._config_mtime = self._get_config_mtime()
         
         self._original_settings = {
-            'default_download_dir': config['general']['default_download_path'],
-            'default_export_dir': config['general']['default_export_path'],
-            'remember_last_paths': config['general']['remember_last_paths'],
-            'auto_open_output': config['general']['auto_open_output'],
-            'confirm_operations': config['general']['confirm_operations'],
-            'download_delay': config['download']['delay_seconds'],
-            'max_retries': config['download']['max_retries'],
-            'timeout': config['download']['timeout_seconds'],
-            'default_gps': config['download']['default_apply_gps'],
-            'default_overlay': config['download']['default_apply_overlay'],
-            'default_timezone': config['download']['default_convert_timezone'],
-            'time_window': config['organize']['time_window_seconds'],
-            'min_score': config['organize']['minimum_score'],
-            'copy_files': config['organize']['copy_files'],
-            'preserve_structure': config['organize']['preserve_structure'],
-            'create_report': config['organize']['create_report'],
+            key: config[section][config_key]
+            for key, section, config_key, *_ in self._FIELDS
         }
         
         # Apply to UI
-        self.default_download_edit.setText(self._original_settings['default_download_dir'])
-        self.default_export_edit.setText(self._original_settings['default_export_dir'])
-        self.remember_last_paths_check.setChecked(self._original_settings['remember_last_paths'])
-        self.auto_open_output_check.setChecked(self._original_settings['auto_open_output'])
-        self.confirm_operations_check.setChecked(self._original_settings['confirm_operations'])
-        self.download_delay_spin.setValue(self._original_settings['download_delay'])
-        self.max_retries_spin.setValue(self._original_settings['max_retries'])
-        self.timeout_spin.setValue(self._original_settings['timeout'])
-        self.default_gps_check.setChecked(self._original_settings['default_gps'])
-        self.default_overlay_check.setChecked(self._original_settings['default_overlay'])
-        self.default_timezone_check.setChecked(self._original_settings['default_timezone'])
-        self.time_window_spin.setValue(self._original_settings['time_window'])
-        self.min_score_spin.setValue(self._original_settings['min_score'])
-        self.copy_files_check.setChecked(self._original_settings['copy_files'])
-        self.preserve_structure_check.setChecked(self._original_settings['preserve_structure'])
-        self.create_report_check.setChecked(self._original_settings['create_report'])
+        self._apply_values(self._original_settings)
         
         logger.info("Settings loaded from config file")
 
+    def _apply_values(self, values: Dict[str, Any]):
+        """Show settings values in their fields.
+        
+        Values for fields on tabs that are not built yet are kept and
+        applied when the tab is first shown.
+        
+        Args:
+            values: Settings values by settings key
+        """
+        for key, _, _, attr, _, setter in self._FIELDS:
+            if key not in values:
+                continue
+            widget = getattr(self, attr, None)
+            if widget is None:
+                self._deferred_values[key] = values[key]
+            else:
+                getattr(widget, setter)(values[key])
+
+    def _collect_values(self) -> Dict[str, Any]:
+        """Read the settings values from their fields.
+        
+        Returns:
+            Settings values by settings key, including those kept for
+            tabs that are not built yet
+        """
+        values = {}
+        for key, _, _, attr, getter, _ in self._FIELDS:
+            widget = getattr(self, attr, None)
+            if widget is None:
+                values[key] = self._deferred_values[key]
+            else:
+                values[key] = getattr(widget, getter)()
+        return values
+
     def _save_settings(self):
         """Save current settings and emit changes."""
-        self._current_settings = {
-            'default_download_dir': self.default_download_edit.text(),
-            'default_export_dir': self.default_export_edit.text(),
-            'remember_last_paths': self.remember_last_paths_check.isChecked(),
-            'auto_open_output': self.auto_open_output_check.isChecked(),
-            'confirm_operations': self.confirm_operations_check.isChecked(),
-            'download_delay': self.download_delay_spin.value(),
-            'max_retries': self.max_retries_spin.value(),
-            'timeout': self.timeout_spin.value(),
-            'default_gps': self.default_gps_check.isChecked(),
-            'default_overlay': self.default_overlay_check.isChecked(),
-            'default_timezone': self.default_timezone_check.isChecked(),
-            'time_window': self.time_window_spin.value(),
-            'min_score': self.min_score_spin.value(),
-            'copy_files': self.copy_files_check.isChecked(),
-            'preserve_structure': self.preserve_structure_check.isChecked(),
-            'create_report': self.create_report_check.isChecked(),
+        self._current_settings = self._collect_values()
+        changed = {
+            key: value
+            for key, value in self._current_settings.items()
+            if self._original_settings.get(key) != value
         }
         
-        # Convert to config format
-        config = load_settings()  # Get current config with all sections
-        config['general']['default_download_path'] = self._current_settings['default_download_dir']
-        config['general']['default_export_path'] = self._current_settings['default_export_dir']
-        config['general']['remember_last_paths'] = self._current_settings['remember_last_paths']
-        config['general']['auto_open_output'] = self._current_settings['auto_open_output']
-        config['general']['confirm_operations'] = self._current_settings['confirm_operations']
-        config['download']['delay_seconds'] = self._current_settings['download_delay']
-        config['download']['max_retries'] = self._current_settings['max_retries']
-        config['download']['timeout_seconds'] = self._current_settings['timeout']
-        config['download']['default_apply_gps'] = self._current_settings['default_gps']
-        config['download']['default_apply_overlay'] = self._current_settings['default_overlay']
-        config['download']['default_convert_timezone'] = self._current_settings['default_timezone']
-        config['organize']['time_window_seconds'] = self._current_settings['time_window']
-        config['organize']['minimum_score'] = self._current_settings['min_score']
-        config['organize']['copy_files'] = self._current_settings['copy_files']
-        config['organize']['preserve_structure'] = self._current_settings['preserve_structure']
-        config['organize']['create_report'] = self._current_settings['create_report']
+        # Nothing to write if no field was edited
+        if not changed:
+            logger.info("Settings unchanged, nothing to save")
+            self.accept()
+            return
+        
+        # Convert to config format, reusing the config read at load time
+        # unless something else has written the file since. Only edited
+        # fields are written, so other values in a re-read file are kept.
+        config = self._config
+        if self._get_config_mtime() != self._config_mtime:
+            config = load_settings()
+        for key, section, config_key, *_ in self._FIELDS:
+            if key in changed:
+                config[section][config_key] = changed[key]
         
         # Save to config file
         if save_settings(config):
+            self._config = config
+            self._config_mtime = self._get_config_mtime()
+            self._original_settings = dict(self._current_settings)
             logger.info("Settings saved to config file")
             
             # Emit changed settings
-            self.settings_changed.emit(self._current_settings)
+            self.settings_changed.emit(changed)
             
             # Show confirmation
             QMessageBox.information(
@@ -491,22 +570,24 @@ class SettingsDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             # Reset to defaults
-            self.default_download_edit.setText(str(Path.home() / "Downloads"))
-            self.default_export_edit.setText(str(Path.home() / "Downloads"))
-            self.remember_last_paths_check.setChecked(True)
-            self.auto_open_output_check.setChecked(False)
-            self.confirm_operations_check.setChecked(True)
-            self.download_delay_spin.setValue(DEFAULT_DOWNLOAD_DELAY)
-            self.max_retries_spin.setValue(3)
-            self.timeout_spin.setValue(30)
-            self.default_gps_check.setChecked(True)
-            self.default_overlay_check.setChecked(True)
-            self.default_timezone_check.setChecked(True)
-            self.time_window_spin.setValue(7200)
-            self.min_score_spin.setValue(45)
-            self.copy_files_check.setChecked(False)
-            self.preserve_structure_check.setChecked(False)
-            self.create_report_check.setChecked(True)
+            self._apply_values({
+                'default_download_dir': str(Path.home() / "Downloads"),
+                'default_export_dir': str(Path.home() / "Downloads"),
+                'remember_last_paths': True,
+                'auto_open_output': False,
+                'confirm_operations': True,
+                'download_delay': DEFAULT_DOWNLOAD_DELAY,
+                'max_retries': 3,
+                'timeout': 30,
+                'default_gps': True,
+                'default_overlay': True,
+                'default_timezone': True,
+                'time_window': 7200,
+                'min_score': 45,
+                'copy_files': False,
+                'preserve_structure': False,
+                'create_report': True,
+            })
             
             logger.info("Settings restored to defaults")
             
@@ -492,6 +492,15 @@ class ToolsTab(QWidget):
         if self._current_tool:
             self.tool_cancelled.emit(self._current_tool)
     
+    def shutdown(self):
+        """Cancel any running tool and wait for the worker to exit."""
+        if self._worker is None:
+            return
+        if self._worker.isRunning():
+            logger.info("Stopping tools worker for shutdown")
+            self._worker.cancel()
+        self._worker.wait()
+    
     @Slot(str)
     def update_statistics(self, stats: str):
         """Update the statistics display.
@@ -4,24 +4,54 @@ This is the main entry point for the Snapchat Organizer Desktop application.
 It initializes the Qt application, creates the main window, and starts the event loop.
 """
 
+import multiprocessing
 import sys
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from PySide6.QtCore import QThreadPool
 from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QFont, QFontMetrics, QIcon
 
 from src.gui.main_window import MainWindow
-from src.gui.download_tab import DownloadTab
-from src.gui.organize_tab import OrganizeTab
-from src.gui.tools_tab import ToolsTab
 from src.utils.config import APP_NAME, APP_VERSION
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Emoji shown in group titles and buttons, and the font families the theme
+# stylesheets ask for
+UI_EMOJI = "ℹ️⚙️📂📁📄📊📅🚀🔧🛠️🔄⏰⏳⚠️✅❌🌍🎨💡"
+UI_FONT_FAMILIES = [
+    "-apple-system",
+    "BlinkMacSystemFont",
+    "Segoe UI",
+    "Roboto",
+    "Helvetica",
+    "Arial",
+    "sans-serif",
+]
+
+
+def prewarm_emoji_font(app: QApplication):
+    """Resolve the emoji fallback font on a pool thread.
+
+    The first time an emoji is laid out Qt has to look up a color emoji
+    font, which is slow on some systems. Measuring them in the background
+    while the main window is built leaves the result in the font database
+    for the first paint.
+
+    Args:
+        app: Running application, whose font is used as the base
+    """
+    font = QFont(app.font())
+    font.setFamilies(UI_FONT_FAMILIES)
+    QThreadPool.globalInstance().start(
+        lambda: QFontMetrics(font).horizontalAdvance(UI_EMOJI)
+    )
+
 
 def main():
     """Main application entry point."""
@@ -35,6 +65,8 @@ def main():
 
     # High DPI scaling is enabled by default in Qt6
 
+    prewarm_emoji_font(app)
+
     # Create main window
     window = MainWindow()
 
@@ -48,25 +80,39 @@ def main():
     # Get icons directory
     icons_dir = Path(__file__).parent.parent / "resources" / "icons"
 
-    # Add actual tab implementations
+    # Add actual tab implementations. Each tab's module is imported and
+    # its widget built the first time the tab is selected, so only the
+    # Download tab is paid for before the window is shown.
+    def make_download_tab():
+        from src.gui.download_tab import DownloadTab
+
+        return DownloadTab()
+
+    def make_organize_tab():
+        from src.gui.organize_tab import OrganizeTab
+
+        return OrganizeTab()
+
+    def make_tools_tab():
+        from src.gui.tools_tab import ToolsTab
+
+        return ToolsTab()
+
     # Download Tab
-    download_tab = DownloadTab()
-    window.tab_widget.addTab(
-        download_tab, QIcon(str(icons_dir / "tab_download.png")), "Download Memories"
+    window.add_lazy_tab(
+        make_download_tab, QIcon(str(icons_dir / "tab_download.png")), "Download Memories"
     )
 
     # Organize Tab
-    organize_tab = OrganizeTab()
-    window.tab_widget.addTab(
-        organize_tab,
+    window.add_lazy_tab(
+        make_organize_tab,
         QIcon(str(icons_dir / "tab_organize.png")),
         "Organize Chat Media",
     )
 
     # Tools Tab
-    tools_tab = ToolsTab()
-    window.tab_widget.addTab(
-        tools_tab, QIcon(str(icons_dir / "tab_tools.png")), "Tools"
+    window.add_lazy_tab(
+        make_tools_tab, QIcon(str(icons_dir / "tab_tools.png")), "Tools"
     )
 
     # Set Download tab as default
@@ -85,4 +131,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -36,7 +36,13 @@ ENABLE_AUTO_UPDATE = False  # Will be enabled in Phase 3
 DEFAULT_DOWNLOAD_DELAY = 2.0  # seconds between requests
 MIN_DOWNLOAD_DELAY = 0.5
 MAX_DOWNLOAD_DELAY = 10.0
+DEFAULT_DOWNLOAD_CONCURRENCY = 4  # parallel downloads in flight
+MIN_DOWNLOAD_CONCURRENCY = 1
+MAX_DOWNLOAD_CONCURRENCY = 16
+PER_HOST_DOWNLOAD_LIMIT = 4  # parallel downloads per CDN host
 DEFAULT_TIMEOUT = 30  # seconds for HTTP requests
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024  # bytes, reusable copy buffer per download thread
+STREAM_CHUNK_SIZE = 64 * 1024  # bytes read per chunk when streaming a download
 MAX_RETRIES = 3
 
 # Organize settings
@@ -106,7 +112,14 @@ WINDOW_DEFAULT_WIDTH = 1100
 WINDOW_DEFAULT_HEIGHT = 750
 
 # Progress update interval (milliseconds)
-PROGRESS_UPDATE_INTERVAL = 100
+PROGRESS_UPDATE_INTERVAL = 33  # ~30 Hz
+
+# How long completion banners stay visible (milliseconds)
+COMPLETION_BANNER_TIMEOUT = 10000
+
+# Progress log: lines kept, and how often buffered lines are flushed (milliseconds)
+PROGRESS_LOG_MAX_LINES = 500
+PROGRESS_LOG_FLUSH_INTERVAL = 100
 
 # File types
 IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp', '.gif', '.heic']
@@ -0,0 +1,145 @@
+"""ExifTool service for Snapchat Organizer Desktop.
+
+This module keeps a single long-running ExifTool process in
+``-stay_open`` mode and streams commands to it, so writing metadata for
+thousands of files costs one ExifTool startup instead of one per file.
+"""
+
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from .config import EXIFTOOL_PATH, VIDEO_EXTENSIONS
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def find_exiftool() -> Optional[str]:
+    """Locate the ExifTool executable.
+    
+    Returns:
+        Path to ExifTool, or None if it is not installed
+    """
+    return shutil.which(EXIFTOOL_PATH or "exiftool")
+
+
+class ExifToolService:
+    """Shared ExifTool process for metadata writes.
+    
+    Commands are serialized with a lock, so one instance can be used from
+    several download threads. Use as a context manager, or call ``start``
+    and ``close`` explicitly.
+    """
+    
+    def __init__(self, executable: str):
+        """Initialize the service.
+        
+        Args:
+            executable: Path to the ExifTool executable
+        """
+        self.executable = executable
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def __enter__(self) -> "ExifToolService":
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def start(self):
+        """Launch the ExifTool process."""
+        if self._process is not None:
+            return
+        
+        # Paths are sent as UTF-8; without -charset filename=utf8 ExifTool
+        # on Windows reads them in the system code page and non-ASCII names
+        # fail. -common_args applies it to every -execute'd command.
+        kwargs = {}
+        if sys.platform == "win32":
+            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+        
+        self._process = subprocess.Popen(
+            [self.executable, "-stay_open", "True", "-@", "-",
+             "-common_args", "-charset", "filename=utf8"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            **kwargs,
+        )
+        logger.info(f"Started ExifTool service: {self.executable}")
+    
+    def close(self):
+        """Ask ExifTool to exit and wait for it."""
+        if self._process is None:
+            return
+        
+        try:
+            self._process.stdin.write("-stay_open\nFalse\n")
+            self._process.stdin.flush()
+            self._process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"ExifTool did not exit cleanly: {e}")
+            self._process.kill()
+        finally:
+            self._process = None
+        
+        logger.info("Stopped ExifTool service")
+    
+    def execute(self, *args: str) -> str:
+        """Run one ExifTool command on the shared process.
+        
+        Args:
+            *args: Command line arguments, one per item
+        
+        Returns:
+            ExifTool output for the command
+        """
+        if self._process is None:
+            raise RuntimeError("ExifTool service is not running")
+        
+        with self._lock:
+            self._process.stdin.write("\n".join(args) + "\n-execute\n")
+            self._process.stdin.flush()
+            
+            output: List[str] = []
+            for line in self._process.stdout:
+                if line.strip() == "{ready}":
+                    break
+                output.append(line)
+        
+        return "".join(output)
+    
+    def write_gps(self, path: Path, latitude: float, longitude: float) -> bool:
+        """Write GPS coordinates into a media file in place.
+        
+        Args:
+            path: Image or video file
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+        
+        Returns:
+            True if ExifTool updated the file
+        """
+        if Path(path).suffix.lower() in VIDEO_EXTENSIONS:
+            tags = [f"-Keys:GPSCoordinates={latitude}, {longitude}"]
+        else:
+            tags = [
+                f"-GPSLatitude={abs(latitude)}",
+                f"-GPSLatitudeRef={'N' if latitude >= 0 else 'S'}",
+                f"-GPSLongitude={abs(longitude)}",
+                f"-GPSLongitudeRef={'E' if longitude >= 0 else 'W'}",
+            ]
+        
+        output = self.execute("-overwrite_original", *tags, str(path))
+        if "1 image files updated" not in output:
+            logger.warning(f"ExifTool could not write GPS to {path}: {output.strip()}")
+            return False
+        return True
@@ -1,7 +1,7 @@
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QPalette, QColor
-from PySide6.QtCore import Qt, QObject, Signal, QTimer
+from PySide6.QtGui import QPalette
+from PySide6.QtCore import QObject, Signal, QTimer
 # Try to import optional darkdetect library for system theme detection
 try:
     import darkdetect
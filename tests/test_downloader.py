@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Tests for the memories downloader core.
+
+Covers:
+- The parsed memories index cache (.snapchat_index.json)
+- Resume: which memories are still pending
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.downloader import DownloadCore
+
+ROW_TEMPLATE = (
+    "<tr><td>{date}</td><td>{media_type}</td>"
+    "<td>Latitude, Longitude: 51.5, -0.12</td>"
+    "<td><a onclick=\"downloadMemories('https://cdn.example.com/m?sid={sid}', "
+    "this, true); return false;\">Download</a></td></tr>"
+)
+
+
+def write_export(html_file: Path, rows):
+    """Write a minimal memories_history.html.
+
+    Args:
+        html_file: File to write
+        rows: (sid, date, media_type) tuples, one per memory
+    """
+    body = "".join(
+        ROW_TEMPLATE.format(sid=sid, date=date, media_type=media_type)
+        for sid, date, media_type in rows
+    )
+    html_file.write_text(f"<html><body><table>{body}</table></body></html>", encoding="utf-8")
+
+
+@pytest.fixture
+def export(tmp_path):
+    """An export with two memories and a downloader for it."""
+    html_file = tmp_path / "memories_history.html"
+    write_export(html_file, [
+        ("sid1", "2023-01-15 12:00:00 UTC", "Image"),
+        ("sid2", "2023-01-16 08:30:00 UTC", "Video"),
+    ])
+    return DownloadCore(html_file=str(html_file), output_dir=str(tmp_path / "out"))
+
+
+def count_parses(monkeypatch, downloader):
+    """Count calls to the downloader's HTML parser.
+
+    Returns:
+        List that gets one entry per parse
+    """
+    calls = []
+    parse = downloader.parse_html_for_memories
+
+    def counting_parse():
+        calls.append(1)
+        return parse()
+
+    monkeypatch.setattr(downloader, "parse_html_for_memories", counting_parse)
+    return calls
+
+
+def test_index_cache_hit(export, monkeypatch):
+    """An unchanged HTML file is loaded from the index without parsing."""
+    calls = count_parses(monkeypatch, export)
+
+    first = export.load_or_parse_memories()
+    assert len(calls) == 1
+    assert export.index_file.exists()
+    assert [m['sid'] for m in first] == ["sid1", "sid2"]
+
+    second = export.load_or_parse_memories()
+    assert len(calls) == 1
+    assert second == first
+
+
+def test_index_cache_reparses_changed_html(export, monkeypatch):
+    """Editing the HTML file invalidates the index."""
+    calls = count_parses(monkeypatch, export)
+    export.load_or_parse_memories()
+
+    old_mtime = export.html_file.stat().st_mtime_ns
+    write_export(export.html_file, [
+        ("sid1", "2023-01-15 12:00:00 UTC", "Image"),
+        ("sid2", "2023-01-16 08:30:00 UTC", "Video"),
+        ("sid3", "2023-01-17 20:45:00 UTC", "Image"),
+    ])
+    # Make sure the change is visible even on coarse-mtime filesystems
+    os.utime(export.html_file, ns=(old_mtime + 10**9, old_mtime + 10**9))
+
+    memories = export.load_or_parse_memories()
+    assert len(calls) == 2
+    assert [m['sid'] for m in memories] == ["sid1", "sid2", "sid3"]
+
+    # The refreshed index is used from now on
+    assert export.load_or_parse_memories() == memories
+    assert len(calls) == 2
+
+
+def test_memory_in_progress_file_is_not_pending(export):
+    """A sid recorded in download_progress.json is skipped."""
+    memories = export.load_or_parse_memories()
+    export.progress_file.write_text(json.dumps({'downloaded': ["sid1"]}))
+    export.load_progress()
+
+    existing = export.scan_existing_files()
+    assert not export.is_pending(memories[0], existing)
+    assert export.is_pending(memories[1], existing)
+
+
+def test_file_already_on_disk_is_not_pending(export):
+    """A memory whose file is already in images/ or videos/ is skipped."""
+    image, video = export.load_or_parse_memories()
+    (export.output_dir / "images" / image['filename']).write_bytes(b"jpeg")
+
+    existing = export.scan_existing_files()
+    assert not export.is_pending(image, existing)
+    assert export.is_pending(video, existing)
+
+
+def test_part_file_leftover_is_still_pending(export):
+    """An interrupted download's .part file doesn't count as downloaded."""
+    image, video = export.load_or_parse_memories()
+    (export.output_dir / "images" / f"{image['filename']}.part").write_bytes(b"jp")
+    (export.output_dir / "videos" / f"{video['filename']}.part").write_bytes(b"mp")
+
+    existing = export.scan_existing_files()
+    assert export.is_pending(image, existing)
+    assert export.is_pending(video, existing)
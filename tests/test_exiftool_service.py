@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Tests for the shared ExifTool process.
+
+Covers, against a fake ExifTool process:
+- Launch arguments (UTF-8 file names, no console window on Windows)
+- Reading command output up to {ready}
+- GPS tags for images (N/S/E/W refs) and videos (Keys:GPSCoordinates)
+"""
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import exiftool_service
+from src.utils.exiftool_service import ExifToolService
+
+UPDATED = ["    1 image files updated\n", "{ready}\n"]
+
+
+class FakeProcess:
+    """Stand-in for the ExifTool Popen object.
+
+    Commands written to stdin are kept in ``stdin``; stdout replays the
+    given lines, one ``{ready}``-terminated block per command.
+    """
+
+    def __init__(self, lines):
+        self.stdin = io.StringIO()
+        self.stdout = iter(lines)
+
+    def commands(self):
+        """Return the argument lists sent to ExifTool, one per -execute."""
+        blocks = self.stdin.getvalue().split("-execute\n")
+        return [block.splitlines() for block in blocks if block]
+
+
+def service_with_output(lines):
+    """Create a service wired to a FakeProcess."""
+    service = ExifToolService("exiftool")
+    service._process = FakeProcess(lines)
+    return service
+
+
+@pytest.fixture
+def popen_calls(monkeypatch):
+    """Capture subprocess.Popen calls made by the service."""
+    calls = []
+
+    def fake_popen(args, **kwargs):
+        calls.append((args, kwargs))
+        return FakeProcess([])
+
+    monkeypatch.setattr(exiftool_service.subprocess, "Popen", fake_popen)
+    return calls
+
+
+def test_start_sets_utf8_filename_charset(popen_calls):
+    """Every command gets -charset filename=utf8 via -common_args."""
+    ExifToolService("exiftool").start()
+
+    args, _ = popen_calls[0]
+    assert args[:5] == ["exiftool", "-stay_open", "True", "-@", "-"]
+    assert args[5:] == ["-common_args", "-charset", "filename=utf8"]
+
+
+def test_start_hides_console_window_on_windows(popen_calls, monkeypatch):
+    """ExifTool is launched without a console window on Windows."""
+    monkeypatch.setattr(exiftool_service.sys, "platform", "win32")
+    monkeypatch.setattr(subprocess, "CREATE_NO_WINDOW", 0x08000000, raising=False)
+    ExifToolService("exiftool").start()
+
+    _, kwargs = popen_calls[0]
+    assert kwargs["creationflags"] == 0x08000000
+
+
+def test_start_without_creationflags_elsewhere(popen_calls, monkeypatch):
+    """No creationflags are passed outside Windows."""
+    monkeypatch.setattr(exiftool_service.sys, "platform", "linux")
+    ExifToolService("exiftool").start()
+
+    _, kwargs = popen_calls[0]
+    assert "creationflags" not in kwargs
+
+
+def test_execute_reads_until_ready():
+    """Each command returns only its own output block."""
+    service = service_with_output([
+        "first line\n", "second line\n", "{ready}\n",
+        "next command\n", "{ready}\n",
+    ])
+
+    assert service.execute("-ver") == "first line\nsecond line\n"
+    assert service.execute("-ver") == "next command\n"
+    assert service._process.commands() == [["-ver"], ["-ver"]]
+
+
+def test_execute_requires_running_process():
+    """Commands fail before start()."""
+    with pytest.raises(RuntimeError):
+        ExifToolService("exiftool").execute("-ver")
+
+
+def test_write_gps_image_positive_coordinates():
+    """Northern/eastern coordinates use N and E refs."""
+    service = service_with_output(UPDATED)
+
+    assert service.write_gps(Path("photo.jpg"), 51.5, 0.12)
+    assert service._process.commands() == [[
+        "-overwrite_original",
+        "-GPSLatitude=51.5",
+        "-GPSLatitudeRef=N",
+        "-GPSLongitude=0.12",
+        "-GPSLongitudeRef=E",
+        "photo.jpg",
+    ]]
+
+
+def test_write_gps_image_negative_coordinates():
+    """Southern/western coordinates are written as absolute values with S and W refs."""
+    service = service_with_output(UPDATED)
+
+    assert service.write_gps(Path("photo.jpg"), -33.87, -70.65)
+    assert service._process.commands() == [[
+        "-overwrite_original",
+        "-GPSLatitude=33.87",
+        "-GPSLatitudeRef=S",
+        "-GPSLongitude=70.65",
+        "-GPSLongitudeRef=W",
+        "photo.jpg",
+    ]]
+
+
+def test_write_gps_video_uses_keys_coordinates():
+    """Videos get signed coordinates in Keys:GPSCoordinates."""
+    service = service_with_output(UPDATED)
+
+    assert service.write_gps(Path("clip.MP4"), -33.87, -70.65)
+    assert service._process.commands() == [[
+        "-overwrite_original",
+        "-Keys:GPSCoordinates=-33.87, -70.65",
+        "clip.MP4",
+    ]]
+
+
+def test_write_gps_reports_failure():
+    """Output without '1 image files updated' returns False."""
+    service = service_with_output([
+        "Error: File not found - missing.jpg\n",
+        "    0 image files updated\n",
+        "{ready}\n",
+    ])
+
+    assert not service.write_gps(Path("missing.jpg"), 1.0, 2.0)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Tests for the download rate limiter.
+
+Covers the token bucket that paces download requests:
+- Sustained rate over time
+- Single-token bursts
+- Cancelling a wait
+- Rejecting non-positive rates
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.rate_limiter import RateLimiter
+
+
+def test_rate_over_time():
+    """Requests beyond the burst are spaced at 1/rate seconds."""
+    limiter = RateLimiter(rate=50)
+
+    start = time.monotonic()
+    for _ in range(11):
+        assert limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # The first token is free; the other 10 take 1/50 s each
+    assert elapsed >= 10 / 50 * 0.9
+    assert elapsed < 1.0
+
+
+def test_burst_of_one():
+    """With burst=1 only the first request goes through immediately."""
+    limiter = RateLimiter(rate=10, burst=1)
+
+    start = time.monotonic()
+    assert limiter.acquire()
+    first = time.monotonic() - start
+    assert limiter.acquire()
+    second = time.monotonic() - start
+
+    assert first < 0.05
+    assert second >= 0.1 * 0.9
+
+
+def test_burst_is_at_least_one():
+    """A burst below one is raised to one token."""
+    limiter = RateLimiter(rate=10, burst=0)
+
+    assert limiter.burst == 1
+    assert limiter.acquire()
+
+
+def test_burst_allows_back_to_back_requests():
+    """A full bucket lets `burst` requests through without waiting."""
+    limiter = RateLimiter(rate=1, burst=3)
+
+    start = time.monotonic()
+    for _ in range(3):
+        assert limiter.acquire()
+
+    assert time.monotonic() - start < 0.05
+
+
+def test_acquire_returns_false_when_cancelled():
+    """A set cancel event makes a waiting acquire give up."""
+    limiter = RateLimiter(rate=0.1)
+    cancel_event = threading.Event()
+    assert limiter.acquire(cancel_event)
+
+    cancel_event.set()
+    start = time.monotonic()
+    assert limiter.acquire(cancel_event) is False
+    assert time.monotonic() - start < 0.5
+
+
+def test_cancel_interrupts_wait_in_progress():
+    """Setting the cancel event from another thread ends the wait early."""
+    limiter = RateLimiter(rate=0.1)
+    cancel_event = threading.Event()
+    assert limiter.acquire(cancel_event)
+
+    timer = threading.Timer(0.1, cancel_event.set)
+    timer.start()
+    try:
+        start = time.monotonic()
+        assert limiter.acquire(cancel_event) is False
+        assert time.monotonic() - start < 2.0
+    finally:
+        timer.cancel()
+
+
+def test_acquire_with_unset_event_still_waits_for_token():
+    """An unset cancel event doesn't skip the wait."""
+    limiter = RateLimiter(rate=20)
+    cancel_event = threading.Event()
+
+    start = time.monotonic()
+    assert limiter.acquire(cancel_event)
+    assert limiter.acquire(cancel_event)
+
+    assert time.monotonic() - start >= 1 / 20 * 0.9
+
+
+@pytest.mark.parametrize("rate", [0, -1, -0.5])
+def test_non_positive_rate_is_rejected(rate):
+    """A rate of zero or less raises ValueError."""
+    with pytest.raises(ValueError):
+        RateLimiter(rate=rate)